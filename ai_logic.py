@@ -4,15 +4,17 @@ from message_scheduler import MessageScheduler
 from tts import ElevenLabsManager, SpeechToTextManager, TTSConversionResult
 from obs_websockets import OBSWebsocketsManager, SUBTITLE_UPDATE_MODE
 from openai_chat import OpenAiManager
-from tools import get_reference, set_reference, debug_print, path_from_app_root
+from tools import get_reference, set_reference, register_reference_factory, debug_print, path_from_app_root
 from PIL import ImageGrab
 import random
 import math
+import functools
 import asyncio
 import time
 import threading
 import textwrap
 import os
+from collections import deque
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -23,18 +25,21 @@ except Exception:  # pragma: no cover - fallback for environments without reques
 
 load_dotenv()
 
+# Event types that are replayed through the custom redemption builder.
+_REDEMPTION_EVENT_TYPES = frozenset({"bits", "channel_points"})
+
 class AssistantManager():
     def __init__(self):
         self.assistant_name = None
         self.stationary_assistant_name = None
         self.recent_subscriptions = []
         self.recent_gifted_subscriptions = []
-        self.chatGPT: OpenAiManager = gpt_manager
+        self.chatGPT: OpenAiManager = get_gpt_manager()
         self.obs: OBSWebsocketsManager = obs_manager
-        self.audio_manager: AudioManager = audio_manager
-        self.elevenlabs: ElevenLabsManager = elevenlabs_manager
-        self.azure: SpeechToTextManager = azure_manager
-        self.event_manager: EventManager = event_manager
+        self.audio_manager: AudioManager = get_audio_manager()
+        self.elevenlabs: ElevenLabsManager = get_elevenlabs_manager()
+        self.azure: SpeechToTextManager = get_speech_to_text_manager()
+        self.event_manager: EventManager = get_event_manager()
         self.online_database = get_reference("OnlineDatabase")
         self.twitch_bot = get_reference("TwitchBot")
         self.handler = get_reference("CommandHandler")
@@ -119,7 +124,7 @@ class AssistantManager():
         if await get_setting("Include STT Context", False):
             try:
                 seconds = await get_setting("Seconds of STT", 10)
-                dictated_context = azure_manager.timed_speechtotext_from_mic(seconds)
+                dictated_context = self.azure.timed_speechtotext_from_mic(seconds)
             except Exception as e:
                 print(f"[ERROR]Error during speech-to-text: {e}")
                 dictated_context = None
@@ -133,7 +138,7 @@ class AssistantManager():
         screenshot_part = f"Description of whats currently on stream (single-frame): {screenshot_result}" if screenshot_result else ""
         prompt = {"role": "user", "content": f"Twitch Chat Messages:\n{messages_str}\n\nTwitch Stream Context: The game currently being played is {game}.\n{speech_part}\n{screenshot_part}."}
         response_prompt = await get_prompt("Message Response Prompt")
-        chatGPT = asyncio.to_thread(gpt_manager.handle_chat, {"role": "system", "content": response_prompt}, prompt, use_twitch_emotes=True)
+        chatGPT = asyncio.to_thread(self.chatGPT.handle_chat, {"role": "system", "content": response_prompt}, prompt, use_twitch_emotes=True)
         response = await chatGPT
         #Normalize emotes
         response_words = response.lower().split()
@@ -149,7 +154,7 @@ class AssistantManager():
         """Generates a general response from chatgpt based on a prompt"""
         debug_print("Assistant", f"Generating general response with prompt: {prompt}")
         welcome_prompt = {"role": "user", "content": await get_prompt("Welcome First Chatter")}
-        chatGPT = asyncio.to_thread(gpt_manager.handle_chat, welcome_prompt, {"role": "user", "content": prompt}, use_twitch_emotes=True)
+        chatGPT = asyncio.to_thread(self.chatGPT.handle_chat, welcome_prompt, {"role": "user", "content": prompt}, use_twitch_emotes=True)
         response = await chatGPT
         return response.lower()
     
@@ -158,7 +163,7 @@ class AssistantManager():
         debug_print("Assistant", "Listening to microphone input for response.")
         self.event_manager.pause()
         stop_listening_key = await get_hotkey("Stop Listening", "p")
-        mic_result = azure_manager.speechtotext_from_mic_continuous(stop_key=stop_listening_key)
+        mic_result = self.azure.speechtotext_from_mic_continuous(stop_key=stop_listening_key)
         if not mic_result or not mic_result.strip():
             print ("Did not receive any input from your microphone!")
             self.event_manager.resume()
@@ -166,7 +171,7 @@ class AssistantManager():
         debug_print("Assistant", f"You said: {mic_result}")
         prompt_text = await get_prompt("Respond to Streamer")
         prompt = {"role": "system", "content": prompt_text}
-        chatGPT = asyncio.to_thread(gpt_manager.handle_chat, prompt, {"role": "user", "content": f"ModdiPly: {mic_result}"})
+        chatGPT = asyncio.to_thread(self.chatGPT.handle_chat, prompt, {"role": "user", "content": f"ModdiPly: {mic_result}"})
         response = await chatGPT
         output = await self.tts(response)
         await self.assistant_responds(output)
@@ -212,7 +217,7 @@ class AssistantManager():
         else:
             recent_messages_str = "\n".join([f"{msg['user']}: {msg['message']}" for msg in recent_messages])
         summary_prompt = {"role": "system", "content": summary_prompt}
-        chatGPT = asyncio.to_thread(gpt_manager.handle_chat, summary_prompt, {"role": "user", "content": "Recent Messages:\n" + recent_messages_str})
+        chatGPT = asyncio.to_thread(self.chatGPT.handle_chat, summary_prompt, {"role": "user", "content": "Recent Messages:\n" + recent_messages_str})
         response = await chatGPT
         debug_print("Assistant",f"Chat Summary: {response}")
         output = await self.tts(response)
@@ -271,7 +276,7 @@ class AssistantManager():
                 else:
                     prompt_2 = {"role": "user", "content": f"{user_name} resubscribed for {cumulative} months! Tier {tier}!"}
 
-            chatGPT = asyncio.to_thread(gpt_manager.handle_chat, resub, prompt_2)
+            chatGPT = asyncio.to_thread(self.chatGPT.handle_chat, resub, prompt_2)
 
             response = await chatGPT
             if text:
@@ -339,7 +344,7 @@ class AssistantManager():
                 prompt_2 = {"role": "user", "content": f"{gifter_str} gifted {total} sub{f"s" if total > 1 else ""} to: {recipients_str}."}
 
             gifted_prompt = await get_prompt("Gifted Sub")
-            chatGPT = asyncio.to_thread(gpt_manager.handle_chat, {"role": "system", "content": gifted_prompt}, prompt_2)
+            chatGPT = asyncio.to_thread(self.chatGPT.handle_chat, {"role": "system", "content": gifted_prompt}, prompt_2)
             response = await chatGPT
             output = await self.tts(response)
             audio_meta = await self._build_audio_metadata(output, subtitle_result=self.latest_tts_result)
@@ -362,7 +367,7 @@ class AssistantManager():
             viewer_count = payload.viewer_count
             raider_name = payload.from_broadcaster.display_name
             prompt_2 = {"role": "user", "content": f"{event["user"]} has raided with {viewer_count} viewers!{f" Last seen playing {game_name}!" if game_name else ""}"}
-            chatGPT = asyncio.to_thread(gpt_manager.handle_chat, {"role": "system", "content": raid_prompt}, prompt_2)
+            chatGPT = asyncio.to_thread(self.chatGPT.handle_chat, {"role": "system", "content": raid_prompt}, prompt_2)
             response = await chatGPT
             output = await self.tts(response)
             audio_meta = await self._build_audio_metadata(output, subtitle_result=self.latest_tts_result)
@@ -656,7 +661,7 @@ class AssistantManager():
 
             bounce_task = asyncio.create_task(
                 self.obs.bounce_while_talking(
-                    audio_manager,
+                    self.audio_manager,
                     volumes,
                     min_vol,
                     max_vol,
@@ -678,7 +683,7 @@ class AssistantManager():
                 await asyncio.sleep(0.12)
             await loop.run_in_executor(
                 None,
-                audio_manager.play_audio,
+                self.audio_manager.play_audio,
                 prepared_path,
                 True,
                 delete_temp,
@@ -696,7 +701,7 @@ class AssistantManager():
             cleaned_up = True
         except asyncio.CancelledError:
             debug_print("Assistant", "Event was cancelled.")
-            audio_manager.stop_playback()
+            self.audio_manager.stop_playback()
             try:
                 if 'bounce_task' in locals() and bounce_task is not None:
                     bounce_task.cancel()
@@ -712,7 +717,7 @@ class AssistantManager():
             raise
         except Exception as exc:
             print(f"assistant_responds failed: {exc}")
-            audio_manager.stop_playback()
+            self.audio_manager.stop_playback()
             if bounce_task is not None:
                 try:
                     bounce_task.cancel()
@@ -861,20 +866,28 @@ class AssistantManager():
         #Unused
 
 class ResponseTimer():
+    SETTINGS_REFRESH_CYCLES = 10
+
     def __init__(self):
         self.db = DATABASE
         self.message_count = 0
         self.received_messages = []
+        # Guards message_count/received_messages so a reset can't interleave with an append.
+        self._state_lock = asyncio.Lock()
         # Do NOT create asyncio tasks at import time (no running loop when GUI imports).
         # The timer can be started explicitly by calling start_timer() from
         # an async context when the event loop is running.
         self.timer_task = None
+        # (min length, max length, min messages, max messages), refreshed every
+        # SETTINGS_REFRESH_CYCLES restarts or when invalidate_settings() is called.
+        self._timer_bounds: tuple[int, int, int, int] | None = None
+        self._cycles_since_refresh = 0
         self.assistant: AssistantManager = get_reference("AssistantManager")
         debug_print("ResponseTimer", "ResponseTimer initialized.")
 
     async def start_timer(self) -> None:
         """Starts the current response timer"""
-        debug_print("ResponseTimer", f"Starting response timer.")
+        debug_print("ResponseTimer", "Starting response timer.")
         chat_response_enabled = await get_setting("Chat Response Enabled", False)
         if not chat_response_enabled:
             debug_print("ResponseTimer", "Chat response is disabled. Timer will not start.")
@@ -883,25 +896,50 @@ class ResponseTimer():
             if not self.timer_task.done():
                 debug_print("ResponseTimer", "Timer is already running. Will not start a new one.")
                 return
+        await self._load_timer_bounds()
+        length, messages = self._pick_timer_params()
+        self.timer_task = asyncio.create_task(self.timer(length, messages))
+
+    async def _load_timer_bounds(self) -> tuple[int, int, int, int]:
+        """Fetches the timer length/message bounds from the database and caches them."""
         maximum_length = await get_setting("Maximum Chat Response Time (seconds)", "600")
         minimum_length = await get_setting("Minimum Chat Response Time (seconds)", "120")
         maximum_messages = await get_setting("Maximum Chat Response Messages", "10")
         minimum_messages = await get_setting("Minimum Chat Response Messages", "1")
-        length = random.randint(minimum_length, maximum_length)
-        messages = random.randint(minimum_messages, maximum_messages)
+        self._timer_bounds = (minimum_length, maximum_length, minimum_messages, maximum_messages)
+        self._cycles_since_refresh = 0
+        return self._timer_bounds
+
+    def _pick_timer_params(self) -> tuple[int, int]:
+        """Returns a random (length, messages) pair within the cached bounds."""
+        minimum_length, maximum_length, minimum_messages, maximum_messages = self._timer_bounds
+        return random.randint(minimum_length, maximum_length), random.randint(minimum_messages, maximum_messages)
+
+    def invalidate_settings(self) -> None:
+        """Forces the next timer cycle to re-read its settings from the database."""
+        self._timer_bounds = None
+
+    def _restart_timer(self) -> None:
+        """Schedules the next timer cycle, reusing cached settings when they are still fresh."""
+        self._cycles_since_refresh += 1
+        if self._timer_bounds is None or self._cycles_since_refresh >= self.SETTINGS_REFRESH_CYCLES:
+            asyncio.create_task(self.start_timer())
+            return
+        length, messages = self._pick_timer_params()
         self.timer_task = asyncio.create_task(self.timer(length, messages))
 
     async def end_timer(self) -> None:
         """Ends the current response timer"""
-        debug_print("ResponseTimer", f"Ending response timer.")
+        debug_print("ResponseTimer", "Ending response timer.")
         if not self.timer_task or self.timer_task.done():
             debug_print("ResponseTimer", "No active timer to end.")
             return
-        self.message_count = 0
-        self.received_messages.clear()
-        if self.timer_task:
-            self.timer_task.cancel()
-            self.timer_task = None
+        async with self._state_lock:
+            self.message_count = 0
+            self.received_messages.clear()
+            if self.timer_task:
+                self.timer_task.cancel()
+                self.timer_task = None
 
     async def timer(self, length: int, messages: int) -> None:
         """Timer for when the AI should respond in chat"""
@@ -912,11 +950,10 @@ class ResponseTimer():
             debug_print("ResponseTimer", f"Timer has ended, now waiting for {messages} messages, currently at {self.message_count} messages.")
             while self.message_count < messages:
                 await asyncio.sleep(1)
-            messages_list = []
-            for message in self.received_messages:
-                messages_list.append(message)
-            self.received_messages.clear()
-            self.message_count = 0
+            async with self._state_lock:
+                messages_list = list(self.received_messages)
+                self.received_messages.clear()
+                self.message_count = 0
             if not self.assistant:
                 self.assistant = get_reference("AssistantManager")
             respond = asyncio.create_task(self.assistant.generate_chat_response(messages_list))
@@ -927,16 +964,17 @@ class ResponseTimer():
         finally:
             self.timer_task = None
             if restart_timer:
-                asyncio.create_task(self.start_timer())
+                self._restart_timer()
         
     async def handle_message(self, user_name: str, text: str, time: str):
         """Adds message to list and updates the message_count."""
         debug_print("ResponseTimer", f"Handling message from {user_name}.")
-        if not self.timer_task or self.timer_task.done():
-            debug_print("ResponseTimer", "Received message while timer is not running; ignoring chat line.")
-            return
-        self.received_messages.append({"user": user_name, "text": text, "time": time})
-        self.message_count += 1
+        async with self._state_lock:
+            if not self.timer_task or self.timer_task.done():
+                debug_print("ResponseTimer", "Received message while timer is not running; ignoring chat line.")
+                return
+            self.received_messages.append({"user": user_name, "text": text, "time": time})
+            self.message_count += 1
 
 class AutoMod():
     def __init__(self):
@@ -956,7 +994,7 @@ class AutoMod():
     def bot_detection(self, message: str) -> bool:
         """Basic bot detection logic."""
         debug_print("AutoMod", f"Running bot detection on message: {message}")
-        return gpt_manager.bot_detector(message)
+        return get_gpt_manager().bot_detector(message)
     
 class EventManager():
     """Manages a queue of events to be played by the assistant at intervals."""
@@ -964,17 +1002,18 @@ class EventManager():
     GACHA_BATCH_SIZE = 5
     GACHA_MIN_HOLD_SECONDS = 6.0
     GACHA_BATCH_HOLD_SECONDS = 8.0
+    MAX_PLAYED_EVENTS = 500
 
     def __init__(self):
         self.db = DATABASE
         self.enabled = False
         self.paused = False
         self.event_queue = []
-        self.played_events = []
+        self.played_events: deque = deque(maxlen=self.MAX_PLAYED_EVENTS)
         self.time_between_events = 10 # seconds
         self.timer = None
         self.currently_playing = False
-        self.task = None
+        self._current_play_task: asyncio.Task | None = None
         self.previous_event = None
         self.assistant: AssistantManager = None
         self.twitch_bot = get_reference("TwitchBot")
@@ -1042,7 +1081,7 @@ class EventManager():
                 self.builder = get_reference("PointBuilder")
             try:
                 self.currently_playing = True
-                if event["type"] in ["bits", "channel_points"]:
+                if event["type"] in _REDEMPTION_EVENT_TYPES:
                     await self.builder.run_custom_redemption(event)
                 elif event["type"] == "gacha":
                     await self._play_gacha_event(event)
@@ -1051,14 +1090,13 @@ class EventManager():
                     if audio_payload is None:
                         debug_print("EventManager", "Event missing audio payload; skipping playback.")
                         return
-                    self.task = asyncio.create_task(self.assistant.assistant_responds(audio_payload))
-                    await self.task
+                    await self._play_audio_payload(audio_payload)
             except Exception as e:
                 print(f"[ERROR]Error playing next event: {e}")
             finally:
                 self.currently_playing = False
                 self.previous_event = event
-                self.played_events.append(event)
+                self._record_played_event(event)
 
     async def play_previous(self) -> None:
         """Plays the previous event."""
@@ -1073,7 +1111,7 @@ class EventManager():
                 self.builder = get_reference("PointBuilder")
             self.currently_playing = True
             try:
-                if self.previous_event["type"] in ["bits", "channel_points"]:
+                if self.previous_event["type"] in _REDEMPTION_EVENT_TYPES:
                     await self.builder.run_custom_redemption(self.previous_event)
                 elif self.previous_event["type"] == "gacha":
                     await self._play_gacha_event(self.previous_event)
@@ -1082,8 +1120,7 @@ class EventManager():
                     if audio_payload is None:
                         debug_print("EventManager", "Previous event missing audio payload; skipping playback.")
                         return
-                    self.task = asyncio.create_task(self.assistant.assistant_responds(audio_payload))
-                    await self.task
+                    await self._play_audio_payload(audio_payload)
             except Exception as e:
                 print(f"[ERROR]Error playing previous event: {e}")
             finally:
@@ -1106,7 +1143,7 @@ class EventManager():
                 self.builder = get_reference("PointBuilder")
             try:
                 self.currently_playing = True
-                if event["type"] in ["bits", "channel_points"]:
+                if event["type"] in _REDEMPTION_EVENT_TYPES:
                     await self.builder.run_custom_redemption(event)
                 elif event["type"] == "gacha":
                     await self._play_gacha_event(event)
@@ -1115,20 +1152,35 @@ class EventManager():
                     if audio_payload is None:
                         debug_print("EventManager", "Selected event missing audio payload; skipping playback.")
                         return
-                    self.task = asyncio.create_task(self.assistant.assistant_responds(audio_payload))
-                    await self.task
+                    await self._play_audio_payload(audio_payload)
             except Exception as e:
                 print(f"[ERROR]Error playing specific event: {e}")
             finally:
                 self.currently_playing = False
                 if not played:
                     self.previous_event = event
-                    self.played_events.append(event)
+                    self._record_played_event(event)
         elif self.currently_playing:
             debug_print("EventManager", "Already playing an event, skipping.")
         else:
             debug_print("EventManager", "No event found to play.")
 
+    def _record_played_event(self, event: dict) -> None:
+        """Appends to the played history, deleting the audio of the event that falls off the end."""
+        if len(self.played_events) == self.played_events.maxlen:
+            evicted = self.played_events[0]
+            if evicted is not event and evicted is not self.previous_event:
+                self._cleanup_event_audio(evicted)
+        self.played_events.append(event)
+
+    async def _play_audio_payload(self, audio_payload) -> None:
+        """Plays an audio payload on the calling task so cancel_current_event can interrupt it."""
+        self._current_play_task = asyncio.current_task()
+        try:
+            await self.assistant.assistant_responds(audio_payload)
+        finally:
+            self._current_play_task = None
+
     async def _play_gacha_event(self, event: dict) -> None:
         if not event:
             return
@@ -1237,7 +1289,8 @@ class EventManager():
         """Removes an event from the queue or played list."""
         debug_print("EventManager", f"Removing event. Played: {played}, Index: {index}")
         if played:
-            event: dict = self.played_events.pop(index)
+            event: dict = self.played_events[index]
+            del self.played_events[index]
             if event == self.previous_event:
                 self.previous_event = None
         else:
@@ -1247,8 +1300,8 @@ class EventManager():
     def cancel_current_event(self) -> None:
         """Cancels the currently playing event."""
         debug_print("EventManager", "Cancelling current event.")
-        if self.task:
-            self.task.cancel()
+        if self._current_play_task:
+            self._current_play_task.cancel()
             self.currently_playing = False
     
     async def clear_events(self) -> None:
@@ -1267,7 +1320,7 @@ class EventManager():
                 except Exception as e:
                     print(f"[ERROR]Error deleting audio file: {e}")
         self.event_queue = []
-        self.played_events = []
+        self.played_events.clear()
     
     async def event_timer(self) -> None:
         """Timer for handling events at intervals. Started if Event Manager is enabled."""
@@ -1282,32 +1335,74 @@ class EventManager():
 async def setup_gpt_manager():
     """Sets up the GPT manager by loading settings from the database."""
     debug_print("AILogic", "Setting up GPT manager with personality prompt.")
-    await gpt_manager.prepare_history()
-
-
-scheduler = MessageScheduler()
-set_reference("MessageScheduler", scheduler)
-auto_mod = AutoMod()
-set_reference("AutoMod", auto_mod)
-gpt_manager = OpenAiManager()
-set_reference("GPTManager", gpt_manager)
-audio_manager = AudioManager()
-set_reference("AudioManager", audio_manager)
-elevenlabs_manager = ElevenLabsManager()
-set_reference("ElevenLabsManager", elevenlabs_manager)
-azure_manager = SpeechToTextManager()
-set_reference("SpeechToTextManager", azure_manager)
-event_manager = EventManager()
-set_reference("EventManager", event_manager)
+    await get_gpt_manager().prepare_history()
+
+
+_manager_lock = threading.RLock()
+
+
+def _lazy_manager(reference_name: str):
+    """Turn a factory into a cached getter that builds and registers the manager on first use."""
+    def decorator(factory):
+        instance = None
+
+        @functools.wraps(factory)
+        def getter():
+            nonlocal instance
+            if instance is None:
+                # RLock because manager constructors resolve other managers.
+                with _manager_lock:
+                    if instance is None:
+                        created = factory()
+                        set_reference(reference_name, created)
+                        instance = created
+            return instance
+
+        register_reference_factory(reference_name, getter)
+        return getter
+    return decorator
+
+
+@_lazy_manager("MessageScheduler")
+def get_message_scheduler() -> MessageScheduler:
+    return MessageScheduler()
+
+@_lazy_manager("AutoMod")
+def get_auto_mod() -> AutoMod:
+    return AutoMod()
+
+@_lazy_manager("GPTManager")
+def get_gpt_manager() -> OpenAiManager:
+    return OpenAiManager()
+
+@_lazy_manager("AudioManager")
+def get_audio_manager() -> AudioManager:
+    return AudioManager()
+
+@_lazy_manager("ElevenLabsManager")
+def get_elevenlabs_manager() -> ElevenLabsManager:
+    return ElevenLabsManager()
+
+@_lazy_manager("SpeechToTextManager")
+def get_speech_to_text_manager() -> SpeechToTextManager:
+    return SpeechToTextManager()
+
+@_lazy_manager("EventManager")
+def get_event_manager() -> EventManager:
+    return EventManager()
+
+@_lazy_manager("AssistantManager")
+def get_assistant_manager() -> AssistantManager:
+    return AssistantManager()
+
+
 obs_manager = None
-assistant = AssistantManager()
-set_reference("AssistantManager", assistant)
 timer_manager = None
 
 # Background timer loop/thread references (timer must run on DB loop)
 _timer_loop = None
 _timer_thread = None
-_timer_loop_ready = threading.Event()
+_timer_loop_lock = threading.Lock()
 
 
 def _loop_is_closed(loop) -> bool:
@@ -1354,7 +1449,7 @@ def _pool_is_closed(pool) -> bool:
 
 def _ensure_response_timer_loop() -> asyncio.AbstractEventLoop:
     """Ensure a dedicated asyncio loop exists for ResponseTimer fallback work."""
-    global _timer_loop, _timer_thread, _timer_loop_ready
+    global _timer_loop, _timer_thread
     if _loop_is_running(_timer_loop):
         return _timer_loop
 
@@ -1369,18 +1464,22 @@ def _ensure_response_timer_loop() -> asyncio.AbstractEventLoop:
             except Exception:
                 pass
 
-    new_loop = asyncio.new_event_loop()
-    _timer_loop_ready = threading.Event()
-    _timer_thread = threading.Thread(
-        target=_run_loop,
-        args=(new_loop, _timer_loop_ready),
-        name="ResponseTimerLoop",
-        daemon=True,
-    )
-    _timer_thread.start()
-    _timer_loop_ready.wait()
-    _timer_loop = new_loop
-    return _timer_loop
+    with _timer_loop_lock:
+        # Another caller may have started the loop while we waited on the lock.
+        if _loop_is_running(_timer_loop):
+            return _timer_loop
+        ready = threading.Event()
+        new_loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=_run_loop,
+            args=(new_loop, ready),
+            name="ResponseTimerLoop",
+            daemon=True,
+        )
+        thread.start()
+        ready.wait()
+        _timer_loop, _timer_thread = new_loop, thread
+        return _timer_loop
 
 def start_timer_manager_in_background():
     """Create a ResponseTimer and start its asyncio loop in a background thread.
@@ -1419,7 +1518,7 @@ def start_timer_manager_in_background():
             if _pool_is_closed(pool_obj) or loop is None or _loop_is_closed(loop):
                 return False
             try:
-                fut = asyncio.run_coroutine_threadsafe(assistant.set_assistant_names(), loop)
+                fut = asyncio.run_coroutine_threadsafe(get_assistant_manager().set_assistant_names(), loop)
                 fut.result(timeout=10)
             except Exception as e:
                 print(f"[WARN] Failed to set assistant names on loop: {e}")
@@ -1,12 +1,24 @@
 import pygame
 import pygame._sdl2.audio as sdl2_audio
+import pygame.sndarray
+import sys
 import time
+import math
+import queue
+import random
+import itertools
+import io
 import os
+import wave
 import asyncio
 import tempfile
 import traceback
+import uuid
 import threading
 import subprocess
+import shutil
+import concurrent.futures
+import numpy as np
 import soundfile as sf
 from mutagen.mp3 import MP3
 from pathlib import Path
@@ -32,113 +44,279 @@ if os.name == "nt":
 from local_ffmpeg import install, is_installed
 from pydub import AudioSegment, utils
 
-AUDIO_DEVICES = []
+AUDIO_DEVICES = []  # replaced wholesale under AudioManager._device_cache_lock; read via AudioManager.audio_devices
 FFMPEG_DIR = path_from_app_root("ffmpeg_bin")
-if not is_installed(str(FFMPEG_DIR)):
-    ok, msg = install(str(FFMPEG_DIR))
-    if not ok:
-        raise RuntimeError(f"FFmpeg install failed: {msg}")
-
-bin_dir = str(FFMPEG_DIR)
-os.environ["PATH"] = bin_dir + os.pathsep + os.environ.get("PATH", "")
-os.environ["FFMPEG_BINARY"] = bin_dir + os.sep + ("ffmpeg.exe" if os.name == "nt" else "ffmpeg")
-os.environ["FFPROBE_BINARY"] = bin_dir + os.sep + ("ffprobe.exe" if os.name == "nt" else "ffprobe")
+# Same rule as check_requirements.ensure_local_ffmpeg: a system FFmpeg on PATH wins unless overridden.
+_SYSTEM_FFMPEG = None if os.environ.get("FORCE_LOCAL_FFMPEG") else shutil.which("ffmpeg")
+_SYSTEM_FFPROBE = None if os.environ.get("FORCE_LOCAL_FFMPEG") else shutil.which("ffprobe")
+if _SYSTEM_FFMPEG and _SYSTEM_FFPROBE:
+    os.environ["FFMPEG_BINARY"] = _SYSTEM_FFMPEG
+    os.environ["FFPROBE_BINARY"] = _SYSTEM_FFPROBE
+else:
+    if not is_installed(str(FFMPEG_DIR)):
+        ok, msg = install(str(FFMPEG_DIR))
+        if not ok:
+            raise RuntimeError(f"FFmpeg install failed: {msg}")
+
+    bin_dir = str(FFMPEG_DIR)
+    os.environ["PATH"] = bin_dir + os.pathsep + os.environ.get("PATH", "")
+    os.environ["FFMPEG_BINARY"] = bin_dir + os.sep + ("ffmpeg.exe" if os.name == "nt" else "ffmpeg")
+    os.environ["FFPROBE_BINARY"] = bin_dir + os.sep + ("ffprobe.exe" if os.name == "nt" else "ffprobe")
+
+# Playable sound effect extensions, in lookup priority when several share a name.
+_SOUND_FX_EXT_PRIORITY = {".mp3": 0, ".wav": 1, ".ogg": 2, ".flac": 3}
+
+_PCM_RATE = 48000
+_PCM_CHANNELS = 2
+_PCM_WIDTH = 2  # bytes per sample (signed 16-bit)
+# Each conversion is its own ffmpeg process; cap how many run at once so a burst
+# of sound FX preparations can use several cores without oversubscribing them.
+_FFMPEG_SLOTS = threading.BoundedSemaphore(min(4, os.cpu_count() or 1))
+# Sound FX preparation/playback gets its own small pool so bursts of redeems don't
+# queue behind (or starve) other users of the loop's default executor.
+_FX_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="audio-fx")
+
+def _decode_to_wav(path: str) -> tuple[bytes, float]:
+    """Decode `path` with a single ffmpeg run into an in-memory 48kHz 16-bit stereo WAV.
+
+    Returns the WAV bytes and their duration in seconds. ffmpeg writes raw PCM to
+    stdout and the header is added here, since a WAV streamed through a pipe
+    cannot have its chunk sizes patched by ffmpeg.
+    """
+    with _FFMPEG_SLOTS:
+        proc = subprocess.run(
+            [
+                os.environ["FFMPEG_BINARY"], "-v", "error", "-nostdin", "-i", str(path),
+                "-f", "s16le", "-acodec", "pcm_s16le", "-ar", str(_PCM_RATE), "-ac", str(_PCM_CHANNELS), "-",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    if proc.returncode != 0 or not proc.stdout:
+        raise RuntimeError(f"ffmpeg could not decode {path}: {proc.stderr.decode(errors='replace').strip()}")
+    pcm = proc.stdout
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_out:
+        wav_out.setnchannels(_PCM_CHANNELS)
+        wav_out.setsampwidth(_PCM_WIDTH)
+        wav_out.setframerate(_PCM_RATE)
+        wav_out.writeframes(pcm)
+    return buffer.getvalue(), len(pcm) / (_PCM_RATE * _PCM_CHANNELS * _PCM_WIDTH)
+
+def _frame_rms(samples: np.ndarray, frame_len: int) -> list[int]:
+    """RMS of consecutive `frame_len`-sample windows in one vectorized pass.
+
+    The final window may be shorter than `frame_len`; its RMS is taken over the
+    samples it actually holds, matching per-slice `AudioSegment.rms`.
+    """
+    if samples.size == 0:
+        return []
+    frame_len = max(1, frame_len)
+    squares = np.square(samples.astype(np.float32, copy=False))
+    full = squares.size // frame_len
+    volumes = np.sqrt(squares[: full * frame_len].reshape(full, frame_len).mean(axis=1)).astype(np.int32).tolist()
+    tail = squares[full * frame_len:]
+    if tail.size:
+        volumes.append(int(np.sqrt(tail.mean())))
+    return volumes
 
 class AudioManager:
-    def __init__(self):
+    DEVICE_CACHE_TTL = 30.0  # seconds before output devices are re-enumerated
+    MIXER_CHANNELS = 16
+    FX_CHANNELS = 4  # reserved for sound effects, handed out round-robin
+    DURATION_CACHE_SIZE = 256
+    # ALSA/PipeWire underrun at 1024 samples; Windows and macOS are fine with the lower latency.
+    DEFAULT_MIXER_BUFFER = 2048 if sys.platform.startswith("linux") else 1024
+
+    def __init__(self, mixer_buffer: int | None = None):
+        self.mixer_buffer = mixer_buffer or self.DEFAULT_MIXER_BUFFER
         self.output_device = None
         self.cached_output_device = None
-        self._should_stop = False
+        self._stop_event = threading.Event()
         self._is_playing = False
         self.device_object = None
         self.list_of_sound_fx = []
+        self._sound_fx_index: dict[str, str] = {}  # lower-cased name -> full path
+        self._sound_fx_dir_mtime: float | None = None
+        self._fx_channels: list = []
+        self._fx_next_channel = 0
+        # _FX_EXECUTOR threads share the round-robin; without this two sounds can land on one channel.
+        self._fx_channel_lock = threading.Lock()
+        # (deadline, seq, paths, attempts, retry_delay) consumed by one lazily started cleanup thread
+        self._cleanup_queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._cleanup_seq = itertools.count()
+        self._cleanup_thread: threading.Thread | None = None
+        self._cleanup_thread_lock = threading.Lock()
         self.prepared_sound_cache: dict[str, dict] = {}
+        # (realpath, mtime) -> seconds; oldest entries are dropped past DURATION_CACHE_SIZE.
+        self._duration_cache: dict[tuple[str, float], float] = {}
+        self._device_cache: list[str] | None = None
+        self._device_cache_time = 0.0
+        self._device_cache_lock = threading.Lock()
         self.init_mixer()
         debug_print("AudioManager", "AudioManager initialized.")
 
     def _delete_file_with_retry(self, path: str | None, attempts: int = 5, delay: float = 0.15) -> bool:
-        """Attempt to delete `path`, retrying when the OS still locks the file."""
+        """Attempt to delete `path` without blocking.
+
+        If the OS still locks the file (pygame holding it open on Windows), it is
+        moved into a pending-delete folder and the cleanup worker retries later
+        with a doubling delay, instead of this call sleeping between attempts.
+        Returns True only when the file is gone now.
+        """
         if not path:
             return False
-        last_err = None
-        for attempt in range(1, max(1, attempts) + 1):
-            try:
-                if os.path.exists(path):
-                    os.remove(path)
-                    debug_print("AudioManager", f"Deleted file: {path}")
-                return True
-            except Exception as exc:
-                last_err = exc
-                time.sleep(max(0.0, delay))
-        if last_err is not None:
-            debug_print(
-                "AudioManager",
-                f"Failed to delete {path} after {attempts} attempts: {last_err}",
-            )
+        try:
+            os.remove(path)
+            debug_print("AudioManager", f"Deleted file: {path}")
+            return True
+        except FileNotFoundError:
+            return True
+        except OSError as exc:
+            if attempts <= 1:
+                debug_print("AudioManager", f"Failed to delete {path}, giving up: {exc}")
+                return False
+        parked = self._park_for_deletion(path)
+        self._schedule_delayed_cleanup([parked], delay, attempts=attempts - 1, retry_delay=delay * 2)
         return False
 
-    def _schedule_delayed_cleanup(self, paths: list[str], wait_seconds: float) -> None:
+    def _park_for_deletion(self, path: str) -> str:
+        """Move a locked file out of the way so its name is free; returns where it now lives."""
+        pending_dir = os.path.join(tempfile.gettempdir(), f"maddieply_pending_delete_{os.getpid()}")
+        if os.path.dirname(os.path.abspath(path)) == pending_dir:
+            return path
+        try:
+            os.makedirs(pending_dir, exist_ok=True)
+            target = os.path.join(pending_dir, f"{uuid.uuid4().hex}_{os.path.basename(path)}")
+            os.replace(path, target)
+            return target
+        except OSError:
+            # Some handles forbid renames too; retry deleting it where it is.
+            return path
+
+    def _schedule_delayed_cleanup(
+        self,
+        paths: list[str],
+        wait_seconds: float,
+        attempts: int = 5,
+        retry_delay: float = 0.15,
+    ) -> None:
         if not paths:
             return
-
-        def _cleanup_worker():
-            time.sleep(max(0.0, wait_seconds))
+        with self._cleanup_thread_lock:
+            if self._cleanup_thread is None or not self._cleanup_thread.is_alive():
+                self._cleanup_thread = threading.Thread(target=self._cleanup_worker, name="AudioCleanup", daemon=True)
+                self._cleanup_thread.start()
+        deadline = time.monotonic() + max(0.0, wait_seconds)
+        self._cleanup_queue.put((deadline, next(self._cleanup_seq), tuple(paths), attempts, retry_delay))
+
+    def _cleanup_worker(self) -> None:
+        """Deletes queued files once their deadlines pass, earliest deadline first."""
+        while True:
+            item = self._cleanup_queue.get()
+            remaining = item[0] - time.monotonic()
+            if remaining > 0:
+                try:
+                    newer = self._cleanup_queue.get(timeout=remaining)
+                except queue.Empty:
+                    pass
+                else:
+                    # Something was queued while waiting; let the queue re-pick the earliest.
+                    self._cleanup_queue.put(newer)
+                    self._cleanup_queue.put(item)
+                    continue
+            _, _, paths, attempts, retry_delay = item
             for target in paths:
-                self._delete_file_with_retry(target)
+                self._delete_file_with_retry(target, attempts=attempts, delay=retry_delay)
 
-        threading.Thread(target=_cleanup_worker, daemon=True).start()
+    @staticmethod
+    def _duration_cache_key(path: str) -> tuple[str, float] | None:
+        try:
+            return os.path.realpath(path), os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def _remember_duration(self, key: tuple[str, float] | None, duration: float | None) -> None:
+        if key is None or duration is None:
+            return
+        if key not in self._duration_cache and len(self._duration_cache) >= self.DURATION_CACHE_SIZE:
+            self._duration_cache.pop(next(iter(self._duration_cache)))
+        self._duration_cache[key] = duration
 
     def _compute_audio_duration(self, path: str | None) -> float | None:
         if not path:
             return None
+        key = self._duration_cache_key(path)
+        cached = self._duration_cache.get(key) if key is not None else None
+        if cached is not None:
+            return cached
+        duration = None
         try:
             _, ext = os.path.splitext(path)
             ext = ext.lower()
             if ext == ".wav":
                 with sf.SoundFile(path) as wav_file:
-                    return wav_file.frames / wav_file.samplerate
-            if ext == ".mp3":
+                    duration = wav_file.frames / wav_file.samplerate
+            elif ext == ".mp3":
                 mp3_file = MP3(path)
-                return mp3_file.info.length
+                duration = mp3_file.info.length
+        except FileNotFoundError:
+            debug_print("AudioManager", f"Cannot determine duration, file is gone: {path}")
         except Exception as exc:
             print(f"Failed to determine duration for {path}: {exc}")
-        return None
+        self._remember_duration(key, duration)
+        return duration
 
     def _wait_for_playback(self, duration: float | None) -> None:
         if duration is None or duration <= 0:
             return
-        elapsed = 0.0
-        interval = 0.1
-        limit = max(0.0, duration)
-        while elapsed < limit:
-            if self._should_stop:
-                debug_print("AudioManager", "Playback flagged to stop early.")
-                self._should_stop = False
-                break
-            time.sleep(interval)
-            elapsed += interval
+        # Wakes immediately when stop_playback() sets the event, otherwise when the clip ends.
+        if self._stop_event.wait(timeout=max(0.0, duration)):
+            debug_print("AudioManager", "Playback flagged to stop early.")
+            self._stop_event.clear()
 
     def init_mixer(self):
         # Initialize mixer with or without a specific device
         if pygame.mixer.get_init():
             pygame.mixer.quit()
+        mixer_kwargs = dict(frequency=48000, size=-16, channels=2, buffer=self.mixer_buffer, allowedchanges=0)
         if self.output_device is not None:
-            pygame.mixer.init(devicename=self.output_device, frequency=48000, buffer=1024)
+            pygame.mixer.init(devicename=self.output_device, **mixer_kwargs)
         else:
-            pygame.mixer.init(frequency=48000, buffer=1024)
+            pygame.mixer.init(**mixer_kwargs)
+        pygame.mixer.set_num_channels(max(self.MIXER_CHANNELS, pygame.mixer.get_num_channels()))
+        # Reserved channels are skipped by Sound.play()'s free-channel search, so sound FX own them.
+        pygame.mixer.set_reserved(self.FX_CHANNELS)
+        with self._fx_channel_lock:
+            self._fx_channels = [pygame.mixer.Channel(i) for i in range(self.FX_CHANNELS)]
+            self._fx_next_channel = 0
         debug_print("AudioManager", f"Pygame mixer initialized with device: {self.output_device}")
 
-    @staticmethod
-    def list_output_devices():
-        devices = sdl2_audio.get_audio_device_names(iscapture=False)
-        for idx, name in enumerate(devices):
-            AUDIO_DEVICES.append(name)
-        return devices
+    def list_output_devices(self, refresh: bool = False) -> list[str]:
+        """Returns output device names, re-enumerating at most every DEVICE_CACHE_TTL seconds."""
+        with self._device_cache_lock:
+            now = time.monotonic()
+            stale = self._device_cache is None or now - self._device_cache_time > self.DEVICE_CACHE_TTL
+            if refresh or stale:
+                devices = list(sdl2_audio.get_audio_device_names(iscapture=False))
+                self._device_cache = devices
+                self._device_cache_time = now
+                AUDIO_DEVICES[:] = devices
+            return list(self._device_cache)
+
+    @property
+    def audio_devices(self) -> tuple[str, ...]:
+        """Snapshot of the last enumerated devices; safe to iterate while a refresh runs."""
+        with self._device_cache_lock:
+            return tuple(AUDIO_DEVICES)
 
     def set_output_device(self, device_name_or_index):
         debug_print("AudioManager", f"Setting output device to: {device_name_or_index}")
         self.cached_output_device = device_name_or_index
         devices = self.list_output_devices()
+        if isinstance(device_name_or_index, str) and device_name_or_index not in devices:
+            # Device may have been plugged in since the last enumeration.
+            devices = self.list_output_devices(refresh=True)
         if isinstance(device_name_or_index, int):
             if 0 <= device_name_or_index < len(devices):
                 self.output_device = devices[device_name_or_index]
@@ -160,39 +338,23 @@ class AudioManager:
         """Quickly warm up the audio system by playing a tiny silent buffer.
 
         This is intended to be run in a thread executor so it doesn't block
-        the main asyncio loop. It creates a short silent WAV, plays it with
-        `play_audio(..., sleep_during_playback=False)`, and removes the file.
+        the main asyncio loop. The silence is built in memory with
+        `pygame.sndarray`, so nothing touches the disk.
         """
         debug_print("AudioManager", "Warming up audio device.")
         try:
             if not pygame.mixer.get_init():
                 self.init_mixer()
-            # Create a tiny silent buffer and write to a temp WAV
-            samples = max(1, int(48000 * (duration_ms / 1000.0)))
-            try:
-                import numpy as _np
-                arr = _np.zeros((samples, 2), dtype=_np.int16)
-            except Exception:
-                # Fall back to simple Python list if numpy isn't available
-                arr = [[0, 0] for _ in range(samples)]
-            tmpf = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-            tmpname = tmpf.name
-            tmpf.close()
-            try:
-                sf.write(tmpname, arr, 48000, format='WAV', subtype='PCM_16')
-                try:
-                    # Play but don't block for the duration
-                    self.play_audio(tmpname, sleep_during_playback=False, delete_file=True, play_using_music=False, volume=0)
-                except Exception as e:
-                    print(f"Warmup playback error: {e}")
-            finally:
-                self._delete_file_with_retry(tmpname)
+            samples = max(1, int(_PCM_RATE * (duration_ms / 1000.0)))
+            silence = pygame.sndarray.make_sound(np.zeros((samples, _PCM_CHANNELS), dtype=np.int16))
+            silence.set_volume(0)
+            silence.play()
         except Exception as e:
             print(f"Warmup failed: {e}")
 
     def stop_playback(self):
         debug_print("AudioManager", "Stopping playback.")
-        self._should_stop = True
+        self._stop_event.set()
         self._is_playing = False
         try:
             pygame.mixer.music.stop()
@@ -206,55 +368,51 @@ class AudioManager:
 
     def play_audio(self, file_path, sleep_during_playback=True, delete_file=False, play_using_music=True, output_device = None, volume: int = 100):
         debug_print("AudioManager", f"Playing audio: {file_path} on device: {output_device if output_device else self.cached_output_device} at volume: {volume}%")
-        converted_tmp = None
-        active_path = file_path
         sound_obj = None
         music_loaded = False
+        converted_source = None  # in-memory WAV; must outlive playback when streamed as music
         playback_duration = None
         volume = max(0, min(100, volume)) / 100.0  # Normalize volume to 0.0 - 1.0
         try:
             if output_device and output_device != self.cached_output_device:
                 self.set_output_device(output_device)
-            self._should_stop = False
+            self._stop_event.clear()
             self._is_playing = True
             if not pygame.mixer.get_init():
                 self.init_mixer()
 
-            def _load_and_play(path):
+            def _load_and_play(source, namehint: str = ""):
                 nonlocal sound_obj, music_loaded
                 if play_using_music:
-                    pygame.mixer.music.load(path)
+                    pygame.mixer.music.load(source, namehint)
                     pygame.mixer.music.set_volume(volume)
                     music_loaded = True
                     pygame.mixer.music.play()
                 else:
-                    sound_obj = pygame.mixer.Sound(path)
+                    sound_obj = pygame.mixer.Sound(source)
                     sound_obj.set_volume(volume)
                     sound_obj.play()
 
             try:
-                _load_and_play(active_path)
+                _load_and_play(file_path)
             except Exception as e:
                 print(f"Initial load failed, attempting conversion: {e}")
                 try:
-                    audio = AudioSegment.from_file(active_path)
-                    audio = audio.set_frame_rate(48000).set_channels(2).set_sample_width(2)
-                    tmpf = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                    converted_tmp = tmpf.name
-                    tmpf.close()
-                    audio.export(converted_tmp, format="wav")
-                    active_path = converted_tmp
-                    _load_and_play(active_path)
+                    wav_bytes, playback_duration = _decode_to_wav(file_path)
+                    self._remember_duration(self._duration_cache_key(file_path), playback_duration)
+                    converted_source = io.BytesIO(wav_bytes)
+                    _load_and_play(converted_source, "wav")
                 except Exception as e2:
                     print(f"Conversion/playback failed: {e2}")
                     raise
 
-            playback_duration = self._compute_audio_duration(active_path)
+            if playback_duration is None:
+                playback_duration = self._compute_audio_duration(file_path)
 
             if sleep_during_playback and playback_duration:
                 self._wait_for_playback(playback_duration)
             elif sleep_during_playback:
-                debug_print("AudioManager", f"Skipping playback wait; duration unavailable for {active_path}.")
+                debug_print("AudioManager", f"Skipping playback wait; duration unavailable for {file_path}.")
         except Exception as e:
             print(f"[ERROR][AudioManager] Error playing audio: {e}\n{traceback.format_exc()}")
         finally:
@@ -274,18 +432,12 @@ class AudioManager:
                 except Exception:
                     pass
                 sound_obj = None
+            converted_source = None
 
             self._is_playing = False
-            self._should_stop = False
+            self._stop_event.clear()
 
-            paths_to_delete = set()
-            if delete_file:
-                paths_to_delete.add(file_path)
-                paths_to_delete.add(active_path)
-            if converted_tmp and converted_tmp not in paths_to_delete:
-                paths_to_delete.add(converted_tmp)
-
-            cleanup_targets = [target for target in paths_to_delete if target]
+            cleanup_targets = [file_path] if delete_file and file_path else []
             if not cleanup_targets:
                 return
 
@@ -320,19 +472,14 @@ class AudioManager:
                     _ = pygame.mixer.Sound(file_path)
                 return file_path, False
             except Exception:
-                # Need to convert to a PCM WAV that pygame will accept
+                # Need to convert to a PCM WAV that pygame will accept: one ffmpeg run
+                # resamples, remixes and requantizes in a single decode.
                 try:
-                    audio = AudioSegment.from_file(file_path)
-                    audio = audio.set_frame_rate(48000).set_channels(2).set_sample_width(2)
-                    tmpf = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                    converted_tmp = tmpf.name
-                    tmpf.close()
-                    audio.export(converted_tmp, format="wav")
-                    # attempt to load converted file to ensure it's valid
-                    if play_using_music:
-                        pygame.mixer.music.load(converted_tmp)
-                    else:
-                        _ = pygame.mixer.Sound(converted_tmp)
+                    wav_bytes, duration = _decode_to_wav(file_path)
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmpf:
+                        converted_tmp = tmpf.name
+                        tmpf.write(wav_bytes)
+                    self._remember_duration(self._duration_cache_key(converted_tmp), duration)
                     return converted_tmp, True
                 except Exception as e:
                     print(f"prepare_playback conversion failed: {e}")
@@ -390,6 +537,13 @@ class AudioManager:
             print(f"Failed to read header for format detection: {e}")
             fmt = None
 
+        # PCM WAV is read straight through soundfile; pydub is only needed for formats it must decode.
+        if fmt == "wav":
+            try:
+                return self._rms_via_soundfile(audio_file)
+            except Exception as e:
+                print(f"Error processing WAV with soundfile, retrying with pydub: {e}")
+
         # Attempt primary load using pydub (ffmpeg). If that fails, fallback to soundfile
         try:
             if fmt == "wav":
@@ -403,56 +557,67 @@ class AudioManager:
                 audio = AudioSegment.from_file(audio_file)
 
             frame_ms = 50
-            frames = [audio[i:i+frame_ms] for i in range(0, len(audio), frame_ms)]
-            volumes = [frame.rms for frame in frames]
-            debug_print("AudioManager", f"Processed audio frames: {len(frames)}, sample duration(ms): {len(audio)}")
+            # Interleaved samples, so a frame spans frame_count * channels entries (as AudioSegment.rms does).
+            samples = np.asarray(audio.get_array_of_samples())
+            frame_len = max(1, int(audio.frame_rate * frame_ms / 1000)) * audio.channels
+            volumes = _frame_rms(samples, frame_len)
+            debug_print("AudioManager", f"Processed audio frames: {len(volumes)}, sample duration(ms): {len(audio)}")
             return volumes, len(audio)
         except Exception as e:
             print(f"Error processing audio with pydub/ffmpeg: {e}")
+            if fmt == "wav":
+                return [], 0  # soundfile already failed on this file above
             debug_print("AudioManager", "Falling back to soundfile-based processing (no ffmpeg required)")
             try:
-                # Use soundfile to read waveform data in blocks and compute RMS per block
-                with sf.SoundFile(audio_file) as f:
-                    sr = f.samplerate
-                    total_frames = f.frames
-                    duration_ms = int((total_frames / sr) * 1000)
-                    block_ms = 50
-                    block_frames = max(1, int(sr * (block_ms / 1000.0)))
-                    volumes = []
-                    f.seek(0)
-                    while True:
-                        data = f.read(block_frames, dtype="int16")
-                        if data is None or len(data) == 0:
-                            break
-                        # data may be mono or stereo
-                        try:
-                            # compute RMS across all channels
-                            import numpy as _np
-                            arr = _np.array(data)
-                            if arr.size == 0:
-                                break
-                            # if multi-dimensional, flatten channels
-                            if arr.ndim > 1:
-                                arr = arr.mean(axis=1)
-                            rms = int((_np.sqrt((_np.square(arr.astype(_np.float64))).mean())))
-                        except Exception:
-                            # Last-resort simple heuristic
-                            rms = 0
-                        volumes.append(rms)
-                    debug_print("AudioManager", f"SoundFile processed blocks: {len(volumes)}, duration_ms: {duration_ms}")
-                    if not volumes:
-                        volumes = [0]
-                    return volumes, duration_ms
+                return self._rms_via_soundfile(audio_file)
             except Exception as e2:
                 print(f"Fallback processing also failed: {e2}")
                 return [], 0
 
+    def _rms_via_soundfile(self, audio_file: str, block_ms: int = 50) -> tuple[list[int], int]:
+        """Per-block RMS volumes and duration (ms) read with soundfile, without ffmpeg."""
+        # Stream the waveform in blocks through one reused buffer and compute RMS per block
+        with sf.SoundFile(audio_file) as f:
+            sr = f.samplerate
+            total_frames = f.frames
+            duration_ms = int((total_frames / sr) * 1000)
+            block_frames = max(1, int(sr * (block_ms / 1000.0)))
+            out = np.empty((block_frames, f.channels), dtype=np.int16)
+            block_volumes = np.empty(max(1, math.ceil(total_frames / block_frames)), dtype=np.int32)
+            count = 0
+            for block in f.blocks(out=out, always_2d=True):
+                if count == block_volumes.size:
+                    # Frame count in the header was short; grow rather than drop blocks.
+                    block_volumes = np.resize(block_volumes, count * 2)
+                # Average the channels to mono before taking the RMS
+                mono = block.mean(axis=1, dtype=np.float32)
+                block_volumes[count] = int(np.sqrt(np.dot(mono, mono) / mono.size))
+                count += 1
+        volumes = block_volumes[:count].tolist()
+        debug_print("AudioManager", f"SoundFile processed blocks: {len(volumes)}, duration_ms: {duration_ms}")
+        if not volumes:
+            volumes = [0]
+        return volumes, duration_ms
+
     async def map_volume_to_y(self, vol, min_vol, max_vol, base_y = 800, max_bounce = 25):
+        return self.map_volume_to_y_sync(vol, min_vol, max_vol, base_y, max_bounce)
+
+    @staticmethod
+    def map_volume_to_y_sync(vol, min_vol, max_vol, base_y = 800, max_bounce = 25):
         if max_vol - min_vol == 0:
             return base_y
         normalized = (vol - min_vol) / (max_vol - min_vol)
         bounce = normalized * max_bounce
         return base_y - bounce
+
+    @staticmethod
+    def map_volumes_to_ys(vols, min_vol, max_vol, base_y = 800, max_bounce = 25) -> np.ndarray:
+        """Vectorized map_volume_to_y_sync: the whole y-trace for a clip's volumes in one pass."""
+        vols = np.asarray(vols, dtype=np.float32)
+        span = max_vol - min_vol
+        if span == 0:
+            return np.full_like(vols, base_y)
+        return base_y - (vols - min_vol) * (max_bounce / span)
     
     async def get_list_of_sound_fx(self):
         if not self.list_of_sound_fx:
@@ -463,37 +628,54 @@ class AudioManager:
         # Scan the 'media/sound_fx' directory for audio files
         sound_fx_dir = path_from_app_root("media", "soundFX")
         sound_fx_list = []
+        index: dict[str, str] = {}
+        self._sound_fx_dir_mtime = self._sound_fx_directory_mtime()
         if not sound_fx_dir.exists():
             debug_print("AudioManager", f"Sound effects directory does not exist: {sound_fx_dir}")
             self.list_of_sound_fx = sound_fx_list
+            self._sound_fx_index = index
             return
-        allowed_exts = ('.mp3', '.wav', '.ogg', '.flac')
-        seen_names = set()
-        for filename in os.listdir(sound_fx_dir):
-            lower_name = filename.lower()
-            if not lower_name.endswith(allowed_exts):
-                continue
-            if lower_name == "test_sound.mp3":
-                continue  # Skip test sound
-            base_name = Path(filename).stem
-            key = base_name.lower()
-            if key in seen_names:
-                continue
-            seen_names.add(key)
-            sound_fx_list.append(base_name)
+        priorities: dict[str, int] = {}
+        # scandir gets the file type from the directory read, so no per-entry stat
+        with os.scandir(sound_fx_dir) as entries:
+            for entry in entries:
+                base_name, ext = os.path.splitext(entry.name)
+                priority = _SOUND_FX_EXT_PRIORITY.get(ext.lower())
+                if priority is None or not entry.is_file():
+                    continue
+                if entry.name.lower() == "test_sound.mp3":
+                    continue  # Skip test sound
+                key = base_name.lower()
+                if key in priorities:
+                    if priority < priorities[key]:
+                        priorities[key] = priority
+                        index[key] = entry.path
+                    continue
+                priorities[key] = priority
+                index[key] = entry.path
+                sound_fx_list.append(base_name)
         self.list_of_sound_fx = sound_fx_list
+        self._sound_fx_index = index
         debug_print("AudioManager", f"Populated sound effects list with {len(self.list_of_sound_fx)} items.")
 
     def _sound_fx_directory(self) -> str:
         return str(path_from_app_root("media", "soundFX"))
 
+    def _sound_fx_directory_mtime(self) -> float | None:
+        try:
+            return os.stat(self._sound_fx_directory()).st_mtime
+        except OSError:
+            return None
+
+    async def _ensure_sound_fx_index(self) -> None:
+        """Rescans the sound FX folder if it was never scanned or files were added/removed since."""
+        if not self._sound_fx_index or self._sound_fx_directory_mtime() != self._sound_fx_dir_mtime:
+            await self.populate_sound_fx_list()
+
     def _find_sound_fx_file(self, sound_fx_name: str) -> str | None:
-        sound_fx_dir = self._sound_fx_directory()
-        for ext in ['.mp3', '.wav', '.ogg', '.flac']:
-            potential_path = os.path.join(sound_fx_dir, sound_fx_name + ext)
-            if os.path.exists(potential_path):
-                return potential_path
-        return None
+        if not sound_fx_name:
+            return None
+        return self._sound_fx_index.get(sound_fx_name.lower())
 
     def get_prepared_sound_fx(self, sound_fx_name: str):
         if not sound_fx_name:
@@ -507,12 +689,13 @@ class AudioManager:
 
     async def check_sound_fx_exists(self, sound_fx_name: str) -> bool:
         debug_print("AudioManager", f"Checking existence of sound effect: {sound_fx_name}")
-        if not self.list_of_sound_fx:
-            await self.populate_sound_fx_list()
-        for file in self.list_of_sound_fx:
-            if file.lower() == sound_fx_name.lower():
-                debug_print("AudioManager", f"Sound effect '{sound_fx_name}' found in list.")
-                return True
+        if not sound_fx_name:
+            return False
+        await self._ensure_sound_fx_index()
+        if sound_fx_name.lower() in self._sound_fx_index:
+            debug_print("AudioManager", f"Sound effect '{sound_fx_name}' found in list.")
+            return True
+        return False
             
     async def play_sound_fx_by_name(
         self,
@@ -530,7 +713,7 @@ class AudioManager:
             debug_print("AudioManager", f"Using preloaded sound for '{sound_fx_name}'.")
 
         volume = await get_setting("Sound FX Volume", 100)
-        await asyncio.to_thread(self._play_prepared_sound, asset, volume)
+        await asyncio.get_running_loop().run_in_executor(_FX_EXECUTOR, self._play_prepared_sound, asset, volume)
 
     async def prepare_sound_fx(self, sound_fx_name: str):
         debug_print("AudioManager", f"Preparing sound effect: {sound_fx_name}")
@@ -546,16 +729,28 @@ class AudioManager:
             debug_print("AudioManager", f"No playable file located for '{sound_fx_name}'.")
             return None
 
-        asset = await asyncio.to_thread(self._prepare_sound_asset, file_path)
+        asset = await asyncio.get_running_loop().run_in_executor(_FX_EXECUTOR, self._prepare_sound_asset, file_path)
         if asset is None:
             return None
         asset["name"] = sound_fx_name
         self._store_prepared_sound_fx(sound_fx_name, asset)
         return asset
 
+    async def warm_sound_fx_cache(self, concurrency: int = 4) -> None:
+        """Decode every sound effect into memory up front so even the first play of each is instant."""
+        await self._ensure_sound_fx_index()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _prepare(name: str):
+            async with semaphore:
+                return await self.prepare_sound_fx(name)
+
+        results = await asyncio.gather(*(_prepare(name) for name in list(self.list_of_sound_fx)), return_exceptions=True)
+        ready = sum(1 for result in results if isinstance(result, dict))
+        debug_print("AudioManager", f"Preloaded {ready}/{len(results)} sound effects.")
+
     async def play_random_sound_fx(self):
         debug_print("AudioManager", "Playing random sound effect.")
-        import random
         if not self.list_of_sound_fx:
             await self.populate_sound_fx_list()
         if not self.list_of_sound_fx:
@@ -565,13 +760,13 @@ class AudioManager:
         await self.play_sound_fx_by_name(chosen_sound)
 
     def _prepare_sound_asset(self, file_path: str):
-        converted_tmp = None
         try:
             if not pygame.mixer.get_init():
                 self.init_mixer()
             try:
                 sound_obj = pygame.mixer.Sound(file_path)
                 duration = sound_obj.get_length()
+                self._remember_duration(self._duration_cache_key(file_path), duration)
                 return {
                     "sound": sound_obj,
                     "duration": duration,
@@ -579,16 +774,10 @@ class AudioManager:
                 }
             except Exception as primary_err:
                 print(f"Direct load failed for '{file_path}': {primary_err}")
-                audio = AudioSegment.from_file(file_path)
-                audio = audio.set_frame_rate(48000).set_channels(2).set_sample_width(2)
-                tmpf = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                converted_tmp = tmpf.name
-                tmpf.close()
-                audio.export(converted_tmp, format="wav")
-                sound_obj = pygame.mixer.Sound(converted_tmp)
+                wav_bytes, _ = _decode_to_wav(file_path)
+                sound_obj = pygame.mixer.Sound(io.BytesIO(wav_bytes))
                 duration = sound_obj.get_length()
-                self._delete_file_with_retry(converted_tmp)
-                converted_tmp = None
+                self._remember_duration(self._duration_cache_key(file_path), duration)
                 return {
                     "sound": sound_obj,
                     "duration": duration,
@@ -596,9 +785,6 @@ class AudioManager:
                 }
         except Exception as e:
             print(f"_prepare_sound_asset error for '{file_path}': {e}")
-        finally:
-            if converted_tmp:
-                self._delete_file_with_retry(converted_tmp)
         return None
 
     def _play_prepared_sound(self, asset: dict, volume_percent: int) -> float:
@@ -607,7 +793,16 @@ class AudioManager:
             return 0.0
         clamped = max(0, min(100, volume_percent)) / 100.0
         sound_obj.set_volume(clamped)
-        sound_obj.play()
+        channel = None
+        if pygame.mixer.get_init():
+            with self._fx_channel_lock:
+                if self._fx_channels:
+                    channel = self._fx_channels[self._fx_next_channel]
+                    self._fx_next_channel = (self._fx_next_channel + 1) % len(self._fx_channels)
+        if channel is not None:
+            channel.play(sound_obj)
+        else:
+            sound_obj.play()
         duration = asset.get("duration")
         if not duration:
             try:
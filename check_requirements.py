@@ -1,73 +1,293 @@
 import subprocess
 import sys
 import os
+import json
+import re
+import shutil
 from pathlib import Path
-from tools import path_from_app_root
 
 REQ_FILE = "requirements.txt"
+# Remembers that requirements.txt (at a given mtime) was fully installed into this interpreter.
+REQ_CACHE_FILE = os.path.join("data", ".req_cache.json")
+# Optional local wheel cache, e.g. filled with `pip download -r requirements.txt -d data/wheelhouse`.
+WHEELHOUSE_DIR = os.path.join("data", "wheelhouse")
+# Written into ffmpeg_bin/ with the local-ffmpeg version once its binaries check out.
+FFMPEG_SENTINEL = ".verified"
+# Leading project name; stops at extras, comparators, markers and whitespace alike.
+_PKG_RE = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9_.\-]*)")
+# Parents come before their children so a single mkdir per entry suffices.
+DIRS = [
+    "data",
+    "media",
+    os.path.join("media", "images_and_gifs"),
+    os.path.join("media", "memes"),
+    os.path.join("media", "screenshots"),
+    os.path.join("media", "soundFX"),
+    os.path.join("media", "voice_audio"),
+]
 
 # Detect installed packages using standard library
 try:
-    from importlib.metadata import distributions
+    from importlib.metadata import PackageNotFoundError, distribution, version
 except ImportError:
     # Python <3.8 fallback
     print("Python 3.8+ is required for this script.")
     sys.exit(1)
 
-installed = {d.metadata["Name"].lower() for d in distributions()}
+# packaging ships alongside pip/setuptools in nearly every environment, but this
+# script runs before requirements are installed, so keep the regex as a fallback.
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.utils import canonicalize_name
+except ImportError:
+    Requirement = None
+    canonicalize_name = None
 
-# Read requirements
-missing = []
-with open(REQ_FILE, encoding="utf-8") as f:
-    for line in f:
-        line = line.strip()
-        if not line or line.startswith("#") or line.startswith("-"):
-            continue
-        # Extract package name (before any version specifiers)
-        pkg = line.split(";", 1)[0].split("==", 1)[0].split(">=", 1)[0].split("<=", 1)[0].split(">", 1)[0].split("<", 1)[0].split("~=", 1)[0].strip().lower()
-        if pkg and pkg not in installed:
-            missing.append(line)
-
-if not missing:
-    print("✅ All packages are already installed.")
-else:
+def canonical_name(name: str) -> str:
+    """PEP 503 normalized project name (what pip and dist-info folder names agree on)."""
+    if canonicalize_name is not None:
+        return canonicalize_name(name)
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def requirement_name(line: str) -> str | None:
+    """Project name of a requirement line, or None if it doesn't apply on this machine.
+
+    Uses packaging when available so extras, direct URLs and environment markers
+    (e.g. `; sys_platform == "win32"`) are handled the way pip handles them.
+    """
+    if Requirement is not None:
+        try:
+            req = Requirement(line)
+        except InvalidRequirement:
+            pass
+        else:
+            if req.marker is not None and not req.marker.evaluate():
+                return None
+            return req.name
+    match = _PKG_RE.match(line)
+    return match.group(1) if match else None
+
+def is_package_installed(name: str) -> bool:
+    """Looks up just this one distribution instead of scanning everything installed."""
+    try:
+        distribution(canonical_name(name))
+    except PackageNotFoundError:
+        return False
+    return True
+
+def parse_requirements(path: str = REQ_FILE) -> list[tuple[str, str]]:
+    """Returns (project name, original line) for each requirement that applies here."""
+    # Small file: slurp once, then filter in one pass
+    lines = [line.strip() for line in Path(path).read_text(encoding="utf-8").splitlines()]
+    wanted = [
+        (name, line)
+        for line in lines
+        if line
+        and not line.startswith(("#", "-"))
+        and (name := requirement_name(line))
+    ]
+    # Later lines win for repeated names, matching pip; also saves duplicate probes/resolves.
+    deduped = list({canonical_name(name): (name, line) for name, line in wanted}.values())
+    if len(deduped) != len(wanted):
+        print(f"[WARN] Ignoring {len(wanted) - len(deduped)} duplicate entries in {path}.")
+    return deduped
+
+def find_missing(wanted: list[tuple[str, str]]) -> list[str]:
+    """Requirement lines whose project isn't installed yet."""
+    # Nothing but comments/options: don't touch installed metadata at all.
+    if not wanted:
+        return []
+    return [line for name, line in wanted if not is_package_installed(name)]
+
+def uses_pip_options(path: str = REQ_FILE) -> bool:
+    """True if the file has lines only pip understands (-r includes, -e, --hash, index options...)."""
+    return any(line.lstrip().startswith("-") for line in Path(path).read_text(encoding="utf-8").splitlines())
+
+def find_missing_via_pip(path: str = REQ_FILE) -> list[str] | None:
+    """Asks pip what `pip install -r path` would install, as `name==version` labels.
+
+    The labels are for reporting only: installing them bare would drop the file's
+    index, hash and editable/URL options, so the caller installs with `-r path`.
+    Returns None when pip can't produce a report (pip < 23, resolver/network error),
+    so the caller can fall back to the local parser.
+    """
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "pip", "install",
+            "--dry-run", "--quiet",
+            "--disable-pip-version-check", "--no-input",
+            "--report", "-",
+            "-r", path,
+        ],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode:
+        return None
+    try:
+        report = json.loads(result.stdout)
+        return [f"{item['metadata']['name']}=={item['metadata']['version']}" for item in report.get("install", [])]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+def _pip_install(requirements: list[str]) -> subprocess.CompletedProcess:
+    """Runs pip quietly; stderr is kept so it can be shown only when the install fails."""
+    cmd = [
+        sys.executable, "-m", "pip", "install",
+        "--quiet",
+        "--disable-pip-version-check",  # skips the PyPI self-version lookup
+        "--no-input",
+        "--prefer-binary",  # take a wheel over a newer sdist rather than building
+    ]
+    if os.path.isdir(WHEELHOUSE_DIR):
+        cmd += ["--find-links", WHEELHOUSE_DIR]
+    return subprocess.run(
+        [*cmd, *requirements],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+
+def install_packages(missing: list[str], requirements_file: str | None = None) -> None:
+    """Installs `missing`, or the whole of `requirements_file` when one is given.
+
+    Pass `requirements_file` when the file has pip options (index URLs, hashes, -e, ...)
+    so pip applies them; `missing` is then only what gets listed to the user.
+    """
+    if not missing:
+        print("✅ All packages are already installed.")
+        return
     print("📦 Installing missing packages:")
     for pkg in missing:
         print("   →", pkg)
-        subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
+    if requirements_file is not None:
+        result = _pip_install(["-r", requirements_file])
+        if result.returncode:
+            sys.stderr.buffer.write(result.stderr)
+            raise SystemExit(f"Failed to install requirements from {requirements_file}")
+        print("✅ Done installing missing packages.")
+        return
+    # One pip run resolves and downloads everything together instead of paying
+    # interpreter/resolver startup per package. Full lines keep any env markers.
+    result = _pip_install(missing)
+    if result.returncode:
+        sys.stderr.buffer.write(result.stderr)
+        # One bad line fails the whole batch; retry individually so the rest still install.
+        print("[WARN] Batch install failed; retrying packages one at a time.")
+        failed = []
+        for pkg in missing:
+            result = _pip_install([pkg])
+            if result.returncode:
+                sys.stderr.buffer.write(result.stderr)
+                failed.append(pkg)
+        if failed:
+            raise SystemExit(f"Failed to install: {', '.join(failed)}")
     print("✅ Done installing missing packages.")
 
-for folder in ["data", "media"]:
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+def ensure_dirs() -> None:
+    for folder in DIRS:
+        try:
+            os.mkdir(folder)
+        except FileExistsError:
+            continue
         print(f"Created missing folder: {folder}")
-        if folder == "media":
-            subfolders = ["images_and_gifs", "memes", "screenshots", "soundFX", "voice_audio"]
-            for subfolder in subfolders:
-                subfolder_path = os.path.join(folder, subfolder)
-                if not os.path.exists(subfolder_path):
-                    os.makedirs(subfolder_path)
-                    print(f"Created missing subfolder: {subfolder_path}")
+
+def _write_ffmpeg_sentinel(sentinel: Path, package_version: str | None) -> None:
+    if package_version is None:
+        return
+    try:
+        sentinel.write_text(package_version, encoding="utf-8")
+    except OSError as exc:
+        print(f"[WARN] Could not record FFmpeg verification: {exc}")
 
 def ensure_local_ffmpeg() -> None:
     """Install bundled FFmpeg binaries via local-ffmpeg so GUI runs under pythonw."""
+    # audio_player applies the same check when choosing which binaries to use.
+    if shutil.which("ffmpeg") and shutil.which("ffprobe") and not os.environ.get("FORCE_LOCAL_FFMPEG"):
+        print("✅ FFmpeg found on PATH; skipping local FFmpeg setup (set FORCE_LOCAL_FFMPEG=1 to override).")
+        return
+
+    from tools import path_from_app_root  # only needed here; keep it off the import path
+
+    target = path_from_app_root("ffmpeg_bin")
+    sentinel = target / FFMPEG_SENTINEL
+    try:
+        package_version = version("local-ffmpeg")
+    except PackageNotFoundError:
+        package_version = None
+    # A matching sentinel means a previous run already verified these binaries
+    # with this local-ffmpeg release; skip the import and the directory scan.
+    if package_version is not None:
+        try:
+            if sentinel.read_text(encoding="utf-8") == package_version:
+                print(f"✅ Local FFmpeg already present at {target}")
+                return
+        except OSError:
+            pass
+
     try:
         from local_ffmpeg import install, is_installed
     except ImportError:
         print("[WARN] local-ffmpeg package missing; skipping FFmpeg binary setup.")
         return
 
-    target = path_from_app_root("ffmpeg_bin")
     target.mkdir(exist_ok=True)
-    if is_installed(str(target)):
+    target_str = os.fspath(target)
+    if is_installed(target_str):
+        _write_ffmpeg_sentinel(sentinel, package_version)
         print(f"✅ Local FFmpeg already present at {target}")
         return
 
     print("[INFO] Local FFmpeg binaries missing; downloading now (one-time).")
-    ok, msg = install(str(target))
+    ok, msg = install(target_str)
     if ok:
+        _write_ffmpeg_sentinel(sentinel, package_version)
         print(f"✅ FFmpeg binaries installed to {target}")
     else:
         raise SystemExit(f"FFmpeg install failed: {msg}")
 
-ensure_local_ffmpeg()
\ No newline at end of file
+def _requirements_cache_key() -> list | None:
+    try:
+        return [os.stat(REQ_FILE).st_mtime_ns, sys.prefix]
+    except OSError:
+        return None
+
+def _requirements_already_satisfied(key: list | None) -> bool:
+    if key is None:
+        return False
+    try:
+        cached = json.loads(Path(REQ_CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return cached.get("key") == key and cached.get("all_installed") is True
+
+def _record_requirements_satisfied(key: list | None) -> None:
+    if key is None:
+        return
+    try:
+        Path(REQ_CACHE_FILE).write_text(json.dumps({"key": key, "all_installed": True}), encoding="utf-8")
+    except OSError as exc:
+        print(f"[WARN] Could not write {REQ_CACHE_FILE}: {exc}")
+
+def main() -> None:
+    key = _requirements_cache_key()
+    if _requirements_already_satisfied(key):
+        # requirements.txt is unchanged since a run that left everything installed
+        print("✅ All packages are already installed.")
+        satisfied = True
+    else:
+        # Our parser skips pip option lines, so let pip resolve (and install) files that use them.
+        missing = find_missing_via_pip(REQ_FILE) if uses_pip_options(REQ_FILE) else None
+        if missing is not None:
+            install_packages(missing, requirements_file=REQ_FILE)
+        else:
+            install_packages(find_missing(parse_requirements(REQ_FILE)))
+        satisfied = False
+    ensure_dirs()
+    if not satisfied:
+        # install_packages raises on failure, so reaching here means everything is in place
+        _record_requirements_satisfied(key)
+    ensure_local_ffmpeg()
+
+if __name__ == "__main__":
+    main()
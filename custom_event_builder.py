@@ -40,16 +40,25 @@ This would generate an automatic voiced response saying "Hello [username], thank
 {"1": {"method": method_reference, "input": "input value from db or user or None"}, 
 "2": {"method1": method_reference1, "method2": method_reference2, "input1": "input value from db or user or None", "input2": "input value from db or user or None"}, ...}"""
 import asyncio
+import collections.abc
 import inspect
+import typing
 import os
+import queue
 import re
+import sys
 import tempfile
+import threading
+import time
+import weakref
 
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from tools import debug_print, get_random_number, get_reference, set_reference, path_from_app_root
-from db import get_custom_reward, get_bit_reward, get_setting
-from meme_creator import make_meme
-from typing import Literal
+from db import cached_get_setting, get_reward_index, get_setting
+from meme_creator import MEME_CAPTION_RE, MEME_FONT_RE, make_meme
+from typing import Callable, Literal, NamedTuple
 from PIL import Image, ImageDraw, ImageFont
 
 
@@ -80,15 +89,156 @@ CODE_BEHAVIOR = {
     "GP": {"db_inputs": 0},  # Gacha Pull
 }
 
-GENERATION_TOKENS = {"AV", "AI", "API", "IC", "IPA", "GM", "VO"}
-VOICE_TOKENS = {"AV", "AI", "API", "VO"}
-CHAT_TOKENS = {"AC", "IC", "IPA"}
-DISPLAY_MEDIA_TOKENS = {"GM", "AN"}
-AUDIO_TOKENS = {"AU"}
+GENERATION_TOKENS = frozenset({"AV", "AI", "API", "IC", "IPA", "GM", "VO"})
+VOICE_TOKENS = frozenset({"AV", "AI", "API", "VO"})
+CHAT_TOKENS = frozenset({"AC", "IC", "IPA"})
+DISPLAY_MEDIA_TOKENS = frozenset({"GM", "AN"})
+AUDIO_TOKENS = frozenset({"AU"})
 PREEXECUTION_TOKENS = GENERATION_TOKENS | AUDIO_TOKENS
+# Playback bucket of each token within a simultaneous group; unlisted tokens are OTHER_CATEGORY.
+AUDIO_CATEGORY, VOICE_CATEGORY, DISPLAY_CATEGORY, OTHER_CATEGORY = range(4)
+TOKEN_CATEGORY = {
+    **dict.fromkeys(DISPLAY_MEDIA_TOKENS, DISPLAY_CATEGORY),
+    **dict.fromkeys(VOICE_TOKENS, VOICE_CATEGORY),
+    **dict.fromkeys(AUDIO_TOKENS, AUDIO_CATEGORY),
+}
+# Patterns are compiled once here; keep new regexes at module level rather than inline.
+_CHEER_RE = re.compile(r"\bcheer\d+\b", re.IGNORECASE)
+# %name% placeholders accepted by string_builder; %rng:min-max% matches with group(1) == None.
+_PLACEHOLDER_RE = re.compile(
+    r"%(?:(bot|user|channel|reward|viewers|followers|subscribers|title|game|message|bits|rng)|rng:(-?\d+)-(-?\d+))%"
+)
 CHAT_MESSAGE_BUFFER_SECONDS = 1.0
 SIMULTANEOUS_MEDIA_STAGGER_SECONDS = 0.5
 SIMULTANEOUS_VOICE_STAGGER_SECONDS = 0.35
+# Keywords _invoke_method forwards to a step method when its signature takes them.
+_DISPATCH_KWARGS = frozenset({"payload", "event", "execute", "cache_key", "token"})
+# function -> _MethodInfo; each step method is inspected once.
+_METHOD_INTROSPECT_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@dataclass(slots=True)
+class _CompiledStep:
+    """One token of a parsed redemption code; inputs are bound per redemption."""
+    token: str
+    method: Callable | None
+    needs_db: int
+    composer: Callable | None
+    group_index: int
+    position_in_group: int
+
+
+@dataclass(slots=True)
+class _CompiledGroup:
+    """A '++' group of steps plus which of them play as audio, voice, display media or anything else."""
+    steps: tuple[_CompiledStep, ...]
+    audio_idx: tuple[int, ...]
+    voice_idx: tuple[int, ...]
+    display_idx: tuple[int, ...]
+    other_idx: tuple[int, ...]
+    contains_chat: bool
+
+
+class _StepSpec(NamedTuple):
+    """One bound step of a simultaneous group, as run_custom_redemption invokes it."""
+    method: Callable | None
+    input: object
+    token: str
+    cache_key: str
+
+
+class _MethodInfo(NamedTuple):
+    """How _invoke_method has to call a step method, worked out once per function."""
+    returns_awaitable: bool
+    accepted: frozenset[str]
+    takes_arg: bool
+    # call(method, arg, payload, event, execute, cache_key, token) passing only what the method takes
+    call: Callable
+
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.VAR_POSITIONAL,
+)
+
+
+# (accepted keywords, takes_arg) -> generated caller; at most 64 distinct shapes exist.
+_DISPATCH_CALLERS: dict[tuple[frozenset[str], bool], Callable] = {}
+
+
+def _dispatch_caller(accepted: frozenset[str], takes_arg: bool) -> Callable:
+    """A caller specialised to one method shape, so dispatch builds no kwargs dict and tests no flags."""
+    key = (accepted, takes_arg)
+    caller = _DISPATCH_CALLERS.get(key)
+    if caller is not None:
+        return caller
+    keywords = ", ".join(f"{name}={name}" for name in sorted(accepted))
+    with_arg = ", ".join(filter(None, ("arg", keywords)))
+    lines = ["def _call(method, arg, payload, event, execute, cache_key, token):"]
+    if takes_arg:
+        lines.append("    if arg is not None:")
+        lines.append(f"        return method({with_arg})")
+    lines.append(f"    return method({keywords})")
+    namespace: dict = {}
+    exec("\n".join(lines), namespace)
+    caller = namespace["_call"]
+    _DISPATCH_CALLERS[key] = caller
+    return caller
+
+
+def _method_info(returns_awaitable: bool, accepted: frozenset[str], takes_arg: bool) -> _MethodInfo:
+    return _MethodInfo(returns_awaitable, accepted, takes_arg, _dispatch_caller(accepted, takes_arg))
+
+
+def _annotation_is_awaitable(annotation) -> bool:
+    origin = typing.get_origin(annotation) or annotation
+    return origin in (collections.abc.Awaitable, collections.abc.Coroutine)
+
+
+def _inspect_callable(method_ref) -> _MethodInfo:
+    is_coro = inspect.iscoroutinefunction(method_ref)
+    # Plain Python functions: read the names straight off the code object (what
+    # inspect.signature would follow __wrapped__ to anyway) without building Parameters.
+    func = inspect.unwrap(getattr(method_ref, "__func__", method_ref))
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        returns_awaitable = is_coro or _annotation_is_awaitable(getattr(func, "__annotations__", {}).get("return"))
+        # A bound method's first positional slot is already taken by self.
+        bound = 1 if getattr(method_ref, "__self__", None) is not None else 0
+        takes_arg = bool(code.co_flags & inspect.CO_VARARGS) or code.co_argcount > bound
+        if code.co_flags & inspect.CO_VARKEYWORDS:
+            return _method_info(returns_awaitable, _DISPATCH_KWARGS, takes_arg)
+        # Positional-only parameters can't be passed by keyword, so skip them.
+        names = code.co_varnames[code.co_posonlyargcount:code.co_argcount + code.co_kwonlyargcount]
+        return _method_info(returns_awaitable, _DISPATCH_KWARGS.intersection(names), takes_arg)
+    try:
+        sig = inspect.signature(method_ref)
+    except (TypeError, ValueError):
+        # Builtins without a signature get only the positional arg.
+        return _method_info(is_coro, frozenset(), True)
+    params = sig.parameters.values()
+    returns_awaitable = is_coro or _annotation_is_awaitable(sig.return_annotation)
+    takes_arg = any(param.kind in _POSITIONAL_KINDS for param in params)
+    if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in params):
+        return _method_info(returns_awaitable, _DISPATCH_KWARGS, takes_arg)
+    return _method_info(returns_awaitable, _DISPATCH_KWARGS.intersection(param.name for param in params), takes_arg)
+
+
+def _introspect(method_ref) -> _MethodInfo:
+    """_MethodInfo for `method_ref`, cached per underlying function."""
+    # Bound methods are rebuilt on every attribute access, so key on the underlying function.
+    key = getattr(method_ref, "__func__", method_ref)
+    try:
+        return _METHOD_INTROSPECT_CACHE[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weak-referenceable (e.g. a builtin); nothing to cache it under.
+        return _inspect_callable(method_ref)
+    info = _inspect_callable(method_ref)
+    _METHOD_INTROSPECT_CACHE[key] = info
+    return info
 
 
 def _extract_user_input(payload, fallback):
@@ -116,30 +266,62 @@ def _extract_user_input(payload, fallback):
     return candidate if candidate not in (None, "") else fallback
 
 
+def _contains_placeholder(value) -> bool:
+    if isinstance(value, str):
+        return USER_INPUT_PLACEHOLDER in value
+    if isinstance(value, dict):
+        return any(_contains_placeholder(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_placeholder(v) for v in value)
+    return False
+
+
 def _resolve_user_value(value, payload, fallback):
-    """Resolve '<user_input>' placeholders within nested values."""
+    """Resolve '<user_input>' placeholders within nested values.
 
-    def _resolve_str(text: str):
-        if USER_INPUT_PLACEHOLDER not in text:
-            return text
-        replacement = _extract_user_input(payload, fallback)
-        if replacement in (None, ""):
-            replacement = fallback
-        if text.strip() == USER_INPUT_PLACEHOLDER:
-            return replacement
-        replacement_str = "" if replacement in (None, "") else str(replacement)
-        return text.replace(USER_INPUT_PLACEHOLDER, replacement_str)
+    Values without a placeholder are returned as-is (no copies), and the viewer
+    input is looked up once per call rather than once per string.
+    """
+    if not _contains_placeholder(value):
+        return value
+    replacement = _extract_user_input(payload, fallback)
+    if replacement in (None, ""):
+        replacement = fallback
+    return _substitute_user_input(value, replacement)
 
+
+def _substitute_user_input(value, replacement):
     if isinstance(value, str):
-        return _resolve_str(value)
+        idx = value.find(USER_INPUT_PLACEHOLDER)
+        if idx == -1:
+            return value
+        end = idx + len(USER_INPUT_PLACEHOLDER)
+        single = value.find(USER_INPUT_PLACEHOLDER, end) == -1
+        if single and not value[:idx].strip() and not value[end:].strip():
+            return replacement  # the whole value is the placeholder: keep the raw input type
+        replacement_str = "" if replacement in (None, "") else str(replacement)
+        if single:
+            return value[:idx] + replacement_str + value[end:]
+        return value.replace(USER_INPUT_PLACEHOLDER, replacement_str)
     if isinstance(value, dict):
-        return {k: _resolve_user_value(v, payload, fallback) for k, v in value.items()}
+        return {k: _substitute_user_input(v, replacement) for k, v in value.items()}
     if isinstance(value, list):
-        return [_resolve_user_value(item, payload, fallback) for item in value]
+        return [_substitute_user_input(item, replacement) for item in value]
     if isinstance(value, tuple):
-        return tuple(_resolve_user_value(item, payload, fallback) for item in value)
+        return tuple(_substitute_user_input(item, replacement) for item in value)
     return value
 
+# Where viewer-typed text may live on a payload, in priority order:
+# ("attr", name) -> payload.name, ("data", keys) -> payload.data[key], ("message",) -> payload.message / .text
+_USER_TEXT_SOURCES = (
+    ("attr", "user_input"),
+    ("attr", "userInput"),
+    ("attr", "input"),
+    ("data", ("user_input", "userInput", "input")),
+    ("message",),
+)
+
+
 def _get_payload_user_text(payload):
     """Return actual viewer-supplied text from payload without falling back to prompts."""
 
@@ -149,79 +331,115 @@ def _get_payload_user_text(payload):
             return stripped if stripped else None
         return None
 
-    if payload is None:
-        return None
-
-    attr_candidates = ("user_input", "userInput", "input")
-    for attr in attr_candidates:
+    def _safe_getattr(obj, name):
         try:
-            candidate = getattr(payload, attr)
+            return getattr(obj, name, None)
         except Exception:
-            candidate = None
-        text = _coerce_text(candidate)
-        if text:
-            return text
+            return None
 
-    # Some payloads expose raw data dicts
-    data_obj = None
-    try:
-        data_obj = getattr(payload, "data", None)
-    except Exception:
-        data_obj = None
-    if isinstance(data_obj, dict):
-        for key in ("user_input", "userInput", "input"):
-            text = _coerce_text(data_obj.get(key))
+    if payload is None:
+        return None
+
+    for source in _USER_TEXT_SOURCES:
+        kind = source[0]
+        if kind == "attr":
+            text = _coerce_text(_safe_getattr(payload, source[1]))
+            if text:
+                return text
+        elif kind == "data":
+            # Some payloads expose raw data dicts
+            data_obj = _safe_getattr(payload, "data")
+            if isinstance(data_obj, dict):
+                for key in source[1]:
+                    text = _coerce_text(data_obj.get(key))
+                    if text:
+                        return text
+        else:
+            # payload.message may be the text itself or an object carrying .text; fetch it once
+            message_obj = _safe_getattr(payload, "message")
+            text = _coerce_text(message_obj) or _coerce_text(_safe_getattr(message_obj, "text"))
             if text:
                 return text
 
-    # Fall back to payload.message if available
-    message_obj = None
-    try:
-        message_obj = getattr(payload, "message", None)
-    except Exception:
-        message_obj = None
-    text = _coerce_text(message_obj)
-    if text:
-        return text
+    return None
+
+
+# Horizontal advance measurers for _measure_text, best first; textbbox also rasterizes glyph outlines.
+def _measure_by_getlength(font, draw, text: str) -> int:
+    return int(font.getlength(text))
+
+
+def _measure_by_textlength(font, draw, text: str) -> int:
+    return int(draw.textlength(text, font=font))
+
 
-    if hasattr(message_obj, "text"):
+def _measure_by_textbbox(font, draw, text: str) -> int:
+    bbox = draw.textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0]
+
+
+def _measure_by_size(font, draw, text: str) -> int:
+    return len(text) * max(1, getattr(font, "size", 12))
+
+
+_TEXT_MEASURERS = (_measure_by_getlength, _measure_by_textlength, _measure_by_textbbox)
+# font -> first measurer that worked for it; values don't reference the font, so entries die with it.
+_FONT_MEASURERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _pick_text_measurer(font, draw) -> Callable:
+    for measurer in _TEXT_MEASURERS:
         try:
-            msg = getattr(message_obj, "text", None)
+            measurer(font, draw, "M")
         except Exception:
-            msg = None
-        text = _coerce_text(msg)
-        if text:
-            return text
-
-    return None
+            continue
+        return measurer
+    return _measure_by_size
 
 class CustomEventBuilder():
     _AUDIO_FILE_EXTENSIONS = (".mp3", ".wav", ".ogg", ".flac")
+    FONT_CACHE_SIZE = 32
+    OVERLAY_PATH_POOL_SIZE = 4
+    # How long a read of the OBS fade-in delay is reused.
+    FADE_DELAY_CACHE_SECONDS = 1.0
+    # Cap on concurrently running chat/wait/other steps across all redemptions.
+    MAX_CONCURRENT_OTHER_STEPS = 16
+    # manager attribute -> get_reference name, for _resolve_managers
+    _MANAGER_REFERENCES = {
+        "online_database": "OnlineDatabase",
+        "event_manager": "EventManager",
+        "gacha_handler": "GachaHandler",
+        "twitch_bot": "TwitchBot",
+        "assistant": "AssistantManager",
+        "obs_manager": "OBSManager",
+    }
     def __init__(self):
         set_reference("EventBuilder", self)
         self.code_behavior = CODE_BEHAVIOR
-        self.response_manager = get_reference("ResponseTimer")
-        self.event_manager = get_reference("EventManager")
-        self.twitch_bot = get_reference("TwitchBot")
-        self.elevenlabs_manager = get_reference("ElevenLabsManager")
-        self.azure_manager = get_reference("SpeechToTextManager")
-        self.assistant = get_reference("AssistantManager")
-        self.chatGPT = get_reference("GPTManager")
-        self.obs_manager = get_reference("OBSManager")
-        self.audio_manager = get_reference("AudioManager")
-        self.gacha_handler = get_reference("GachaHandler")
-        self.online_database = get_reference("OnlineDatabase")
+        # Manager references are cached_property lookups resolved on first use (see below).
         self.discord_bot = None
         self.media_dir = path_from_app_root("media")
-        self.media_dir.mkdir(exist_ok=True)
         self.images_and_gifs_dir = self.media_dir / "images_and_gifs"
         self.memes_dir = self.media_dir / "memes"
         self.screenshots_dir = self.media_dir / "screenshots"
         self.sounds_dir = self.media_dir / "soundFX"
         self.voice_audio_dir = self.media_dir / "voice_audio"
-        self.voice_audio_dir.mkdir(parents=True, exist_ok=True)
         self.voice_overlay_template = self.images_and_gifs_dir / "speaker.png"
         self._overlay_font_dir = path_from_app_root("media", "fonts")
+        # (size, bold) -> loaded overlay font; oldest entry dropped past FONT_CACHE_SIZE
+        self._font_cache: dict[tuple[int, bool], object] = {}
+        # canvas size -> (speaker.png mtime, (resized icon, shadow layer, alpha mask))
+        self._overlay_icon_cache: dict[tuple[int, int], tuple[float, tuple]] = {}
+        # (loop, future, args) jobs for the single overlay composition thread, started on first use
+        self._overlay_queue: queue.Queue = queue.Queue()
+        self._overlay_thread: threading.Thread | None = None
+        self._overlay_thread_lock = threading.Lock()
+        # Reusable overlay PNG names; a slot is out while OBS shows it and returned afterwards.
+        self._overlay_pool_slots = frozenset(
+            str(self.voice_audio_dir / f"_overlay_{i}.png") for i in range(self.OVERLAY_PATH_POOL_SIZE)
+        )
+        self._overlay_path_pool: list[str] = sorted(self._overlay_pool_slots)
+        self._overlay_pool_lock = threading.Lock()
         self.code_decryption_map = {"AV": self.automatic_voiced_response,
                                     "AI": self.ai_generated_voiced_response,
                                     "API": self.ai_generated_voiced_response_personality,
@@ -235,8 +453,66 @@ class CustomEventBuilder():
                                     "VO": self.voiced_message,
                                     "TO": self.timeout
                                     }
+        # raw redemption code -> compiled groups of steps
+        self._plan_cache: dict[str, list[_CompiledGroup]] = {}
+        # (monotonic time read, fade-in delay) from the last OBS lookup
+        self._fade_cache: tuple[float, float] | None = None
+        self._other_step_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_OTHER_STEPS)
         debug_print("CustomBuilder", "CustomEventBuilder initialized.")
 
+    # Resolved on first access rather than in __init__, so building the CustomEventBuilder
+    # doesn't construct lazily-created managers nobody has used yet. The existing
+    # `if not self.x: self.x = get_reference(...)` refreshes still work (they assign over the cache).
+    @cached_property
+    def response_manager(self):
+        return get_reference("ResponseTimer")
+
+    @cached_property
+    def event_manager(self):
+        return get_reference("EventManager")
+
+    @cached_property
+    def twitch_bot(self):
+        return get_reference("TwitchBot")
+
+    @cached_property
+    def elevenlabs_manager(self):
+        return get_reference("ElevenLabsManager")
+
+    @cached_property
+    def azure_manager(self):
+        return get_reference("SpeechToTextManager")
+
+    @cached_property
+    def assistant(self):
+        return get_reference("AssistantManager")
+
+    @cached_property
+    def chatGPT(self):
+        return get_reference("GPTManager")
+
+    @cached_property
+    def obs_manager(self):
+        return get_reference("OBSManager")
+
+    @cached_property
+    def audio_manager(self):
+        return get_reference("AudioManager")
+
+    @cached_property
+    def gacha_handler(self):
+        return get_reference("GachaHandler")
+
+    @cached_property
+    def online_database(self):
+        return get_reference("OnlineDatabase")
+
+    def _resolve_managers(self, *names: str) -> None:
+        """Fill in any of the named manager attributes that are still unset (registered after first use)."""
+        for name in names:
+            if getattr(self, name) is None:
+                setattr(self, name, get_reference(self._MANAGER_REFERENCES[name]))
+
     async def _refresh_browser_overlays(self) -> None:
         manager = self.obs_manager or get_reference("OBSManager")
         self.obs_manager = manager
@@ -248,29 +524,68 @@ class CustomEventBuilder():
         except Exception as exc:
             debug_print("CustomBuilder", f"OBS browser refresh failed: {exc}")
 
-    def _prepare_input_for_token(self, token: str, inputs: list | None, input_ptr: int) -> tuple:
-        behavior = self.code_behavior.get(token.upper(), {})
-        needs_db_value = int(behavior.get("db_inputs", 0) or 0)
+    @staticmethod
+    def _bind_step_input(needs_db: int, composer: Callable | None, inputs: list | None, input_ptr: int) -> tuple:
         value = None
-        if needs_db_value > 0:
+        if needs_db > 0:
             if inputs is not None and input_ptr < len(inputs):
                 value = inputs[input_ptr]
             input_ptr += 1
-        composer = behavior.get("compose")
-        if callable(composer):
+        if composer is not None:
             try:
                 value = composer(value)
             except Exception:
                 pass
         return value, input_ptr
 
+    def _compile_plan(self, code: str) -> list[_CompiledGroup]:
+        """Split `code` into groups of compiled steps; done once per distinct code string."""
+        plan: list[_CompiledGroup] = []
+        # split into groups separated by '::' — each group can contain one or more codes separated by '++'
+        groups = [g.strip() for g in code.split("::") if g is not None and g.strip() != ""]
+        for grp in groups:
+            subcodes = [c.strip() for c in grp.split("++") if c is not None and c.strip() != ""]
+            if len(subcodes) == 0:
+                continue
+            compiled_group = []
+            for position, subcode in enumerate(subcodes, start=1):
+                # Interned so every later membership test against the token sets is a pointer-compare hit.
+                token = sys.intern(subcode.upper())
+                behavior = self.code_behavior.get(token, {})
+                composer = behavior.get("compose")
+                compiled_group.append(
+                    _CompiledStep(
+                        token=token,
+                        method=self.code_decryption_map.get(token),
+                        needs_db=int(behavior.get("db_inputs", 0) or 0),
+                        composer=composer if callable(composer) else None,
+                        group_index=len(plan),
+                        position_in_group=position,
+                    )
+                )
+            # Playback buckets for simultaneous groups (indexed by category), each kept in code order.
+            buckets = ([], [], [], [])
+            for idx, compiled in enumerate(compiled_group):
+                buckets[TOKEN_CATEGORY.get(compiled.token, OTHER_CATEGORY)].append(idx)
+            plan.append(
+                _CompiledGroup(
+                    steps=tuple(compiled_group),
+                    audio_idx=tuple(buckets[AUDIO_CATEGORY]),
+                    voice_idx=tuple(buckets[VOICE_CATEGORY]),
+                    display_idx=tuple(buckets[DISPLAY_CATEGORY]),
+                    other_idx=tuple(buckets[OTHER_CATEGORY]),
+                    contains_chat=any(compiled.token in CHAT_TOKENS for compiled in compiled_group),
+                )
+            )
+        return plan
+
     async def build_actions(self, custom_reward: dict | None = None, code: str | None = None, inputs: list | None = None) -> list:
         """Parse a redemption `code` (or a `custom_reward` DB row) into a list of step dictionaries.
 
         Each returned item represents either a single sequential step:
             {"step": method_ref, "input": inputs[index]}
-        or a simultaneous group with multiple numbered entries:
-            {"step1": method_ref1, "input1": inputs[i], "step2": method_ref2, "input2": inputs[i+1], ...}
+        or a simultaneous group, its steps bound in code order:
+            {"_group": _CompiledGroup, "_specs": (_StepSpec(method_ref1, inputs[i], token1, cache_key1), ...), "_contains_chat": bool}
 
         If `custom_reward` is provided it will be used to extract `code` and `input1..input10`.
         """
@@ -284,58 +599,51 @@ class CustomEventBuilder():
         if code is None:
             return []
 
-        # split into groups separated by '::' — each group can contain one or more codes separated by '++'
-        groups = [g.strip() for g in code.split("::") if g is not None and g.strip() != ""]
+        # The same reward fires with the same code every time; only the inputs differ.
+        plan = self._plan_cache.get(code)
+        if plan is None:
+            plan = self._compile_plan(code)
+            self._plan_cache[code] = plan
 
         steps = []
         input_ptr = 0
         step_counter = 0
-        for grp in groups:
-            subcodes = [c.strip() for c in grp.split("++") if c is not None and c.strip() != ""]
-            if len(subcodes) == 0:
-                continue
-
-            if len(subcodes) == 1:
-                token = subcodes[0].upper()
-                method = self.code_decryption_map.get(token)
-                inp, input_ptr = self._prepare_input_for_token(token, inputs, input_ptr)
+        for group in plan:
+            if len(group.steps) == 1:
+                compiled = group.steps[0]
+                inp, input_ptr = self._bind_step_input(compiled.needs_db, compiled.composer, inputs, input_ptr)
                 step_counter += 1
                 steps.append(
                     {
-                        "step": method,
+                        "step": compiled.method,
                         "input": inp,
-                        "token": token,
+                        "token": compiled.token,
                         "cache_key": f"step_{step_counter}",
+                        # Decided once here so the run loops skip the isinstance/'%' probe.
+                        "_needs_build": isinstance(inp, str) and "%" in inp,
+                        "_contains_chat": group.contains_chat,
                     }
                 )
             else:
-                # simultaneous group — create numbered keys step1,input1, step2,input2, ...
-                group_entry = {}
-                for i, token in enumerate(subcodes, start=1):
-                    tok = token.upper()
-                    method = self.code_decryption_map.get(tok)
-                    inp, input_ptr = self._prepare_input_for_token(tok, inputs, input_ptr)
+                # simultaneous group — bind each step straight into a spec tuple
+                specs = []
+                for compiled in group.steps:
+                    inp, input_ptr = self._bind_step_input(compiled.needs_db, compiled.composer, inputs, input_ptr)
                     step_counter += 1
-                    group_entry[f"step{i}"] = method
-                    group_entry[f"input{i}"] = inp
-                    group_entry[f"token{i}"] = tok
-                    group_entry[f"cache_key{i}"] = f"step_{step_counter}"
-                steps.append(group_entry)
+                    specs.append(_StepSpec(compiled.method, inp, compiled.token, f"step_{step_counter}"))
+                steps.append(
+                    {
+                        "_group": group,
+                        "_specs": tuple(specs),
+                        "_contains_chat": group.contains_chat,
+                    }
+                )
 
         return steps
 
-    def _method_accepts_kwarg(self, method_ref, kw_name: str) -> bool:
-        try:
-            sig = inspect.signature(method_ref)
-        except (TypeError, ValueError):
-            return True
-        for param in sig.parameters.values():
-            if param.kind == inspect.Parameter.VAR_KEYWORD:
-                return True
-        return kw_name in sig.parameters
-
     def _token_needs_generation(self, token: str | None) -> bool:
-        return bool(token and token.upper() in PREEXECUTION_TOKENS)
+        # build_actions only emits upper-cased tokens
+        return bool(token and token in PREEXECUTION_TOKENS)
 
     def _get_cached_asset(self, event: dict | None, cache_key: str | None):
         if not event or not cache_key:
@@ -351,17 +659,6 @@ class CustomEventBuilder():
         bucket = event.setdefault("_generated_assets", {})
         bucket[cache_key] = data
 
-    def _entry_contains_chat_token(self, entry: dict | None) -> bool:
-        if not isinstance(entry, dict):
-            return False
-        token = entry.get("token")
-        if isinstance(token, str) and token.upper() in CHAT_TOKENS:
-            return True
-        for key, value in entry.items():
-            if key.startswith("token") and isinstance(value, str) and value.upper() in CHAT_TOKENS:
-                return True
-        return False
-
     def _normalize_audio_fx_name(self, file_name: str | None) -> str:
         """Strip known audio extensions so AudioManager can locate the asset."""
         if not isinstance(file_name, str):
@@ -442,10 +739,7 @@ class CustomEventBuilder():
     async def _run_voice_overlay_task(self, overlay_path: str, duration: float, ready_event: asyncio.Event | None):
         manager = self.obs_manager or get_reference("OBSManager")
         if manager is None:
-            try:
-                os.remove(overlay_path)
-            except Exception:
-                pass
+            self._release_overlay_path(overlay_path)
             return
         self.obs_manager = manager
         try:
@@ -464,10 +758,7 @@ class CustomEventBuilder():
                 object_name_override=object_name,
             )
         finally:
-            try:
-                os.remove(overlay_path)
-            except Exception:
-                pass
+            self._release_overlay_path(overlay_path)
 
     async def _render_voice_overlay_image(self, username: str, message: str, payload) -> str | None:
         overlay_text = (message or "").strip()
@@ -504,19 +795,51 @@ class CustomEventBuilder():
             except Exception:
                 bits_display = bits_amount
             header_text = f"{username or 'Viewer'} donated {bits_display} bits:"
-            overlay_text = re.sub(r"(?i)\\bcheer\\d+\\b", "", overlay_text).strip()
+            overlay_text = _CHEER_RE.sub("", overlay_text).strip()
 
         try:
-            return await asyncio.to_thread(
-                self._compose_voice_overlay_image,
-                username,
-                overlay_text,
-                header_text,
-            )
+            return await self._submit_overlay_render(username, overlay_text, header_text)
         except Exception as exc:
             print(f"Failed to compose voice overlay image: {exc}")
             return None
 
+    async def _submit_overlay_render(self, username: str, message: str, header_text: str) -> str:
+        """Queue a composition on the dedicated overlay thread and await its result (FIFO)."""
+        with self._overlay_thread_lock:
+            if self._overlay_thread is None or not self._overlay_thread.is_alive():
+                self._overlay_thread = threading.Thread(target=self._overlay_worker, name="VoiceOverlay", daemon=True)
+                self._overlay_thread.start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._overlay_queue.put((loop, future, (username, message, header_text)))
+        return await future
+
+    def _overlay_worker(self) -> None:
+        def _deliver(future: asyncio.Future, result, error):
+            if future.done():
+                # Caller gave up (cancelled) before we finished; return the file so the slot isn't lost.
+                if result is not None:
+                    self._release_overlay_path(result)
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        while True:
+            loop, future, args = self._overlay_queue.get()
+            result = error = None
+            try:
+                result = self._compose_voice_overlay_image(*args)
+            except Exception as exc:
+                error = exc
+            try:
+                loop.call_soon_threadsafe(_deliver, future, result, error)
+            except RuntimeError:
+                # Loop already closed; nobody will display the file.
+                if result is not None:
+                    self._release_overlay_path(result)
+
     def _compose_voice_overlay_image(self, username: str, message: str, header_text: str) -> str:
         canvas = None
         width, height = 960, 420
@@ -524,36 +847,21 @@ class CustomEventBuilder():
         draw = ImageDraw.Draw(canvas, "RGBA")
         padding = max(32, canvas.width // 30)
 
-        speaker_path = self.images_and_gifs_dir / "speaker.png"
         icon_bottom = padding
-        if speaker_path.exists():
-            try:
-                with Image.open(speaker_path) as icon_img_src:
-                    icon_img = icon_img_src.convert("RGBA")
-                max_icon_width = int(canvas.width * 0.4)
-                max_icon_height = int(canvas.height * 0.35)
-                scale_w = max_icon_width / icon_img.width if icon_img.width else 1.0
-                scale_h = max_icon_height / icon_img.height if icon_img.height else 1.0
-                scale = min(scale_w, scale_h, 1.0)
-                new_w = max(1, int(icon_img.width * scale))
-                new_h = max(1, int(icon_img.height * scale))
-                resample_attr = getattr(Image, "Resampling", None)
-                resample_filter = resample_attr.LANCZOS if resample_attr else getattr(Image, "LANCZOS", Image.BICUBIC)
-                icon_resized = icon_img.resize((new_w, new_h), resample=resample_filter)
-                icon_x = (canvas.width - new_w) // 2
-                icon_y = padding
-                shadow_offset = max(2, new_w // 60)
-                try:
-                    icon_alpha = icon_resized.split()[3]
-                except Exception:
-                    icon_alpha = None
-                if icon_alpha is not None:
-                    shadow_image = Image.new("RGBA", icon_resized.size, (255, 255, 255, 160))
-                    canvas.paste(shadow_image, (icon_x + shadow_offset, icon_y + shadow_offset), icon_alpha)
-                canvas.paste(icon_resized, (icon_x, icon_y), icon_resized)
-                icon_bottom = icon_y + new_h
-            except Exception:
-                icon_bottom = padding
+        try:
+            prepared_icon = self._prepared_overlay_icon(canvas.size)
+        except Exception:
+            prepared_icon = None
+        if prepared_icon is not None:
+            icon_resized, shadow_image, icon_alpha = prepared_icon
+            new_w, new_h = icon_resized.size
+            icon_x = (canvas.width - new_w) // 2
+            icon_y = padding
+            shadow_offset = max(2, new_w // 60)
+            if icon_alpha is not None:
+                canvas.paste(shadow_image, (icon_x + shadow_offset, icon_y + shadow_offset), icon_alpha)
+            canvas.paste(icon_resized, (icon_x, icon_y), icon_resized)
+            icon_bottom = icon_y + new_h
 
         header_line = header_text or f"{username or 'Viewer'} says:"
         parts = header_line.split(" ", 1)
@@ -607,20 +915,119 @@ class CustomEventBuilder():
             max_words_per_line=words_per_line,
         )
         line_spacing = max(8, int(body_size * 0.25))
-        for line in wrapped_lines:
-            line_width = self._measure_text(draw, line, body_font)
-            line_x = max(padding, (canvas.width - line_width) / 2)
-            draw.text((line_x + shadow_offset, text_y + shadow_offset), line, font=body_font, fill=shadow_color)
-            draw.text((line_x, text_y), line, font=body_font, fill=(255, 255, 255, 255))
-            text_y += body_size + line_spacing
+        # Draw the whole body as one block (shadow, then fill) and let Pillow center each
+        # line; multiline_text advances by the "A" glyph height plus `spacing`, so pick the
+        # spacing that keeps the original body_size + line_spacing line pitch.
+        wrapped_text = "\n".join(wrapped_lines)
+        glyph_height = draw.textbbox((0, 0), "A", font=body_font)[3]
+        block_spacing = body_size + line_spacing - glyph_height
+        center_x = canvas.width / 2
+        draw.multiline_text(
+            (center_x + shadow_offset, text_y + shadow_offset),
+            wrapped_text,
+            font=body_font,
+            fill=shadow_color,
+            anchor="ma",
+            spacing=block_spacing,
+            align="center",
+        )
+        draw.multiline_text(
+            (center_x, text_y),
+            wrapped_text,
+            font=body_font,
+            fill=(255, 255, 255, 255),
+            anchor="ma",
+            spacing=block_spacing,
+            align="center",
+        )
 
+        self.voice_audio_dir.mkdir(parents=True, exist_ok=True)
+        output_path = self._acquire_overlay_path()
+        # Fast zlib level: the PNG only lives for one overlay, size barely matters.
+        canvas.save(output_path, optimize=False, compress_level=1)
+        return output_path
+
+    def _acquire_overlay_path(self) -> str:
+        with self._overlay_pool_lock:
+            if self._overlay_path_pool:
+                return self._overlay_path_pool.pop(0)
+        # Every slot is on screen; fall back to a one-off file.
         output_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png", dir=self.voice_audio_dir)
-        temp_path = output_file.name
         output_file.close()
-        canvas.save(temp_path)
-        return temp_path
+        return output_file.name
+
+    def _release_overlay_path(self, path: str) -> None:
+        """Hand a pooled overlay file back for reuse; one-off files are deleted."""
+        if path in self._overlay_pool_slots:
+            with self._overlay_pool_lock:
+                if path not in self._overlay_path_pool:
+                    self._overlay_path_pool.append(path)
+            return
+        self._schedule_unlink(path)
+
+    def _schedule_unlink(self, path: str) -> None:
+        """Delete `path` off the event loop; OBS may still hold the file open on Windows."""
+        manager = self.audio_manager
+        if manager is not None:
+            # AudioManager's cleanup thread already retries locked files with backoff.
+            manager._schedule_delayed_cleanup([path], 0.0)
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _prepared_overlay_icon(self, canvas_size: tuple[int, int]):
+        """Speaker icon resized for `canvas_size` plus its shadow layer and alpha mask.
+
+        Built once and reused until speaker.png changes on disk; returns None when the
+        icon is missing.
+        """
+        speaker_path = self.voice_overlay_template
+        try:
+            mtime = speaker_path.stat().st_mtime
+        except OSError:
+            return None
+        cached = self._overlay_icon_cache.get(canvas_size)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        canvas_w, canvas_h = canvas_size
+        with Image.open(speaker_path) as icon_img_src:
+            if icon_img_src.mode != "RGBA":
+                icon_img = icon_img_src.convert("RGBA")
+            else:
+                icon_img = icon_img_src.copy()  # detach from the file handle closed below
+        max_icon_width = int(canvas_w * 0.4)
+        max_icon_height = int(canvas_h * 0.35)
+        scale_w = max_icon_width / icon_img.width if icon_img.width else 1.0
+        scale_h = max_icon_height / icon_img.height if icon_img.height else 1.0
+        scale = min(scale_w, scale_h, 1.0)
+        new_w = max(1, int(icon_img.width * scale))
+        new_h = max(1, int(icon_img.height * scale))
+        resample_attr = getattr(Image, "Resampling", None)
+        resample_filter = resample_attr.LANCZOS if resample_attr else getattr(Image, "LANCZOS", Image.BICUBIC)
+        icon_resized = icon_img.resize((new_w, new_h), resample=resample_filter)
+        try:
+            icon_alpha = icon_resized.getchannel("A")
+        except Exception:
+            icon_alpha = None
+        shadow_image = Image.new("RGBA", icon_resized.size, (255, 255, 255, 160)) if icon_alpha is not None else None
+        prepared = (icon_resized, shadow_image, icon_alpha)
+        self._overlay_icon_cache[canvas_size] = (mtime, prepared)
+        return prepared
 
     def _load_overlay_font(self, size: int, bold: bool = False):
+        # The candidate list only depends on `bold`, so (size, bold) identifies the result.
+        key = (size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._find_overlay_font(size, bold)
+            if len(self._font_cache) >= self.FONT_CACHE_SIZE:
+                self._font_cache.pop(next(iter(self._font_cache)))
+            self._font_cache[key] = font
+        return font
+
+    def _find_overlay_font(self, size: int, bold: bool):
         candidates: list[str] = []
         if bold:
             candidates.extend(["Montserrat-SemiBold.ttf", "SegoeUI-Semibold.ttf", "arialbd.ttf"])
@@ -655,6 +1062,8 @@ class CustomEventBuilder():
         paragraphs = text.splitlines() or [text]
         lines: list[str] = []
         truncated = False
+        # Measure each word once and add widths up, instead of re-measuring every growing prefix.
+        space_width = self._measure_text(draw, " ", font)
         for paragraph in paragraphs:
             words = paragraph.split()
             if not words:
@@ -664,26 +1073,28 @@ class CustomEventBuilder():
                     truncated = True
                 continue
             current_words: list[str] = []
+            current_width = 0
             for word in words:
-                candidate_words = current_words + [word]
-                candidate_text = " ".join(candidate_words)
+                word_width = self._measure_text(draw, word, font)
                 exceeds_word_limit = (
                     max_words_per_line is not None
                     and current_words
-                    and len(candidate_words) > max_words_per_line
+                    and len(current_words) + 1 > max_words_per_line
                 )
                 exceeds_width = (
                     current_words
-                    and self._measure_text(draw, candidate_text, font) > max_width
+                    and current_width + space_width + word_width > max_width
                 )
                 if exceeds_word_limit or exceeds_width:
                     lines.append(" ".join(current_words))
                     current_words = [word]
+                    current_width = word_width
                     if len(lines) >= max_lines:
                         truncated = True
                         break
                 else:
-                    current_words = candidate_words
+                    current_width = current_width + space_width + word_width if current_words else word_width
+                    current_words.append(word)
             if len(lines) >= max_lines:
                 truncated = True
                 break
@@ -706,23 +1117,27 @@ class CustomEventBuilder():
         return lines
 
     def _measure_text(self, draw: ImageDraw.ImageDraw, text: str, font) -> int:
+        # What a font supports is probed once; after that this is a lookup and a direct call.
         try:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            return bbox[2] - bbox[0]
-        except Exception:
-            try:
-                if hasattr(font, "getlength"):
-                    return int(font.getlength(text))
-            except Exception:
-                pass
-            try:
-                size = font.getsize(text)
-                return size[0]
-            except Exception:
-                return len(text) * max(1, getattr(font, "size", 12))
+            measurer = _FONT_MEASURERS[font]
+        except KeyError:
+            measurer = _FONT_MEASURERS[font] = _pick_text_measurer(font, draw)
+        except TypeError:
+            # Not weak-referenceable; probe without remembering.
+            measurer = _pick_text_measurer(font, draw)
+        return measurer(font, draw, text)
 
     def _display_fade_in_delay(self) -> float:
         """Retrieve the OBS fade-in delay so audio can align with media visibility."""
+        now = time.monotonic()
+        cached = self._fade_cache
+        if cached is not None and now - cached[0] < self.FADE_DELAY_CACHE_SECONDS:
+            return cached[1]
+        value = self._read_display_fade_in_delay()
+        self._fade_cache = (now, value)
+        return value
+
+    def _read_display_fade_in_delay(self) -> float:
         manager = self.obs_manager
         if not manager:
             manager = get_reference("OBSManager")
@@ -741,11 +1156,6 @@ class CustomEventBuilder():
                 return max(0.0, float(attr_val))
         return 0.5
     
-    def _ensure_assistant(self):
-        if not self.assistant:
-            self.assistant = get_reference("AssistantManager")
-        return self.assistant
-
     async def _build_voice_asset(
         self,
         audio_path: str,
@@ -755,9 +1165,12 @@ class CustomEventBuilder():
         subtitle_result: dict | None = None,
         extra: dict | None = None,
     ):
-        assistant = self._ensure_assistant()
-        audio_meta = None
-        if assistant:
+        # Resolved by run_custom_redemption before any step runs.
+        assistant = self.assistant
+        # Steps of one event that land on the same audio file share its volume analysis.
+        meta_cache = event.setdefault("_audio_meta_cache", {}) if event is not None else None
+        audio_meta = meta_cache.get(audio_path) if meta_cache is not None else None
+        if audio_meta is None and assistant:
             try:
                 subtitle_seed = subtitle_result
                 if subtitle_seed is None:
@@ -765,6 +1178,8 @@ class CustomEventBuilder():
                 audio_meta = await assistant._build_audio_metadata(audio_path, subtitle_result=subtitle_seed)
             except Exception:
                 audio_meta = None
+            if audio_meta and meta_cache is not None:
+                meta_cache[audio_path] = audio_meta
         if not audio_meta:
             audio_meta = {
                 "path": audio_path,
@@ -782,7 +1197,7 @@ class CustomEventBuilder():
     async def _play_voice_asset(self, asset: dict | None):
         if not asset:
             return
-        assistant = self._ensure_assistant()
+        assistant = self.assistant
         if not assistant:
             return
         audio_meta = asset.get("audio_meta")
@@ -805,54 +1220,16 @@ class CustomEventBuilder():
         """Call a method reference with optional arg; await if it is a coroutine/function that returns coroutine."""
         if method_ref is None:
             return None
-        accepts_payload_kw = self._method_accepts_kwarg(method_ref, "payload")
-        accepts_event_kw = self._method_accepts_kwarg(method_ref, "event")
-        accepts_execute_kw = self._method_accepts_kwarg(method_ref, "execute")
-        accepts_cache_kw = self._method_accepts_kwarg(method_ref, "cache_key")
-        accepts_token_kw = self._method_accepts_kwarg(method_ref, "token")
-
-        def _build_kwargs():
-            kwargs = {}
-            if accepts_payload_kw:
-                kwargs["payload"] = payload
-            if accepts_event_kw:
-                kwargs["event"] = event
-            if accepts_execute_kw:
-                kwargs["execute"] = execute
-            if accepts_cache_kw:
-                kwargs["cache_key"] = cache_key
-            if accepts_token_kw:
-                kwargs["token"] = token
-            return kwargs
-
-        try:
-            # If method is coroutine function, call with arg or no-arg accordingly
-            if inspect.iscoroutinefunction(method_ref):
-                kwargs = _build_kwargs()
-                if arg is None:
-                    return await method_ref(**kwargs)
-                return await method_ref(arg, **kwargs)
-            else:
-                # call synchronously; if it returns coroutine, await it
-                kwargs = _build_kwargs()
-                if arg is None:
-                    res = method_ref(**kwargs)
-                else:
-                    res = method_ref(arg, **kwargs)
-                if inspect.isawaitable(res):
-                    return await res
-                return res
-        except TypeError:
-            # fallback: try calling with no args
-            try:
-                res = method_ref()
-                if inspect.isawaitable(res):
-                    return await res
-                return res
-            except Exception:
-                return None
+        info = _introspect(method_ref)
+        # Methods that take no positional parameter are called without the step input,
+        # decided from their signature up front rather than by retrying on TypeError.
+        res = info.call(method_ref, arg, payload, event, execute, cache_key, token)
+        if info.returns_awaitable:
+            return await res
+        return res
 
     async def channel_points_redemption_handler(self, payload, redeem_type: Literal["custom", "auto"]) -> None:
+        self._resolve_managers("online_database", "event_manager", "gacha_handler", "twitch_bot")
         # Determine redemption name depending on payload type, determined by if reward has title attribute or type attribute
         if redeem_type == "auto":
             redemption_name = payload.reward.type
@@ -864,132 +1241,128 @@ class CustomEventBuilder():
         if redemption_name in ["30-second ad time", "90-second ad time"]:
             command_handler = get_reference("CommandHandler")
             if command_handler.shared_chat:
-                if get_setting("Shared Chat Custom Channel Point Redemptions Enabled", False):
+                if await cached_get_setting("Shared Chat Custom Channel Point Redemptions Enabled", False):
                     if redemption_name == "30-second ad time":
                         duration = 30
                     elif redemption_name == "90-second ad time":
                         duration = 90
                     await command_handler.play_ad(length=duration)
                 return
-        change_set_name = await get_setting("Gacha Change Set Redemption Name", "Change Gacha Set")
-        gacha_pull_name = await get_setting("Gacha Pull Redemption Name", "Gacha Pull")
-        gacha_enabled = await get_setting("Gacha System Enabled", False)
+        change_set_name, gacha_pull_name, gacha_enabled = await asyncio.gather(
+            cached_get_setting("Gacha Change Set Redemption Name", "Change Gacha Set"),
+            cached_get_setting("Gacha Pull Redemption Name", "Gacha Pull"),
+            cached_get_setting("Gacha System Enabled", False),
+        )
         if redemption_name in [change_set_name, gacha_pull_name]:
             if not gacha_enabled:
                 debug_print("CustomBuilder", f"Gacha system is disabled; ignoring redemption: {redemption_name}")
                 try:
                     payload.refund(token_for=self.bot.owner_id)
-                    if not self.twitch_bot:
-                        self.twitch_bot = get_reference("TwitchBot")
                     self.twitch_bot.send_chat("The gacha system is currently disabled. Your channel points have been refunded.")
                 except Exception as e:
                     print(f"Failed to refund redemption for disabled gacha system: {e}")
                 return
         user_id = payload.user.id
 
-        if not self.online_database:
-            self.online_database = get_reference("OnlineDatabase")
-        if not self.event_manager:
-            self.event_manager = get_reference("EventManager")
-        if not self.gacha_handler:
-            self.gacha_handler = get_reference("GachaHandler")
-
-        if not await self.online_database.user_exists(user_id):
-            debug_print("CustomBuilder", f"User ID: {user_id} does not exist in the database. Creating user entry.")
-            data = {"twitch_username": payload.user.name, "twitch_display_name": payload.user.display_name, "active_gacha_set": "humble beginnings"}
-            await self.online_database.create_user(user_id, data)
-
-        await self.online_database.increment_column(table="users", column_filter="twitch_id", value=user_id, column_to_increment="channel_points_redeemed", increment_by=points)
-        if not self.gacha_handler:
-            debug_print("CustomBuilder", "GachaHandler reference missing or is disabled.")
-        else:
-            if redemption_name == change_set_name:
-                if self.gacha_handler:
+        # Nothing below reads the redeemer's row except the gacha paths, so the online DB
+        # round-trips overlap the reward lookup and asset pre-generation instead of preceding them.
+        record_task = asyncio.create_task(self._record_channel_point_redeemer(payload, points))
+        try:
+            if not self.gacha_handler:
+                debug_print("CustomBuilder", "GachaHandler reference missing or is disabled.")
+            else:
+                if redemption_name == change_set_name:
+                    await record_task
                     await self.gacha_handler.handle_gacha_set_change(payload)
-                return
-            elif redemption_name == gacha_pull_name:
-                if not self.gacha_handler:
-                    self.gacha_handler = get_reference("GachaHandler")
-                if self.gacha_handler:
+                    return
+                elif redemption_name == gacha_pull_name:
+                    await record_task
                     await self._refresh_browser_overlays()
                     event = await self.gacha_handler.roll_for_gacha(twitch_user_id=user_id, twitch_display_name=payload.user.display_name, num_pulls=1)
                     if type(event) is dict:
                         self.event_manager.add_event(event)
                     else:
                         debug_print("CustomBuilder", "Gacha pull did not return a valid event dictionary.")
-                return
+                    return
         
-        custom_reward = await get_custom_reward(redemption_name, "channel_points")
-        if not custom_reward:
-            return
-        # Build parsed methods and delegate execution to run_custom_redemption
-        try:
-            parsed = await self.build_actions(custom_reward=custom_reward)
-            raw_user_input = _get_payload_user_text(payload)
-            user_input_value = raw_user_input if raw_user_input is not None else _extract_user_input(payload, None)
-            event = {
-                "type": "channel_points",
-                "id": custom_reward.get("id") if isinstance(custom_reward, dict) else None,
-                "code": custom_reward.get("code") if isinstance(custom_reward, dict) else None,
-                "parsed_methods": parsed,
-                "payload": payload,
-                "user_input": user_input_value,
-                "user_input_raw": raw_user_input,
-                "event_type": f"channel point redemption of {redemption_name} by {payload.user.display_name}"
-            }
+            # In-memory index of enabled rewards; reloaded only after the GUI edits them.
+            custom_reward = (await get_reward_index()).custom_reward(redemption_name, "channel_points")
+            if not custom_reward:
+                return
+            # Build parsed methods and delegate execution to run_custom_redemption
             try:
-                debug_print("CustomBuilder", f"Pre-generating assets for redemption event code: {event['code']}")
-                await self.run_custom_redemption(event, execute=False)
-            except Exception as precache_err:
-                print(f"Pre-generation failed: {precache_err}")
-            self.event_manager.add_event(event)
-        except Exception as e:
-            print(f"channel_points_redemption_handler error: {e}")
-        return
+                parsed = await self.build_actions(custom_reward=custom_reward)
+                raw_user_input = _get_payload_user_text(payload)
+                user_input_value = raw_user_input if raw_user_input is not None else _extract_user_input(payload, None)
+                event = {
+                    "type": "channel_points",
+                    "id": custom_reward.get("id") if isinstance(custom_reward, dict) else None,
+                    "code": custom_reward.get("code") if isinstance(custom_reward, dict) else None,
+                    "parsed_methods": parsed,
+                    "payload": payload,
+                    "user_input": user_input_value,
+                    "user_input_raw": raw_user_input,
+                    "event_type": f"channel point redemption of {redemption_name} by {payload.user.display_name}"
+                }
+                try:
+                    debug_print("CustomBuilder", f"Pre-generating assets for redemption event code: {event['code']}")
+                    await self.run_custom_redemption(event, execute=False)
+                except Exception as precache_err:
+                    print(f"Pre-generation failed: {precache_err}")
+                self.event_manager.add_event(event)
+            except Exception as e:
+                print(f"channel_points_redemption_handler error: {e}")
+        finally:
+            # Always awaited so a failed DB write is reported here rather than lost with the task.
+            await record_task
+
+    async def _record_channel_point_redeemer(self, payload, points) -> None:
+        """Create the redeemer's user row if needed and add `points` to their channel_points_redeemed."""
+        user_id = payload.user.id
+        if not await self.online_database.user_exists(user_id):
+            debug_print("CustomBuilder", f"User ID: {user_id} does not exist in the database. Creating user entry.")
+            data = {"twitch_username": payload.user.name, "twitch_display_name": payload.user.display_name, "active_gacha_set": "humble beginnings"}
+            await self.online_database.create_user(user_id, data)
+        await self.online_database.increment_column(table="users", column_filter="twitch_id", value=user_id, column_to_increment="channel_points_redeemed", increment_by=points)
     
     async def handle_cheer(self, payload):
         bits = payload.bits
         user_id = payload.user.id
         gacha_task = None
-        if not self.online_database:
-            self.online_database = get_reference("OnlineDatabase")
-        await self.online_database.increment_column(table="users", column_filter="twitch_id", value=payload.user.id, column_to_increment="bits_donated", increment_by=bits)
+        self._resolve_managers("online_database", "event_manager", "gacha_handler", "twitch_bot", "assistant")
         number_of_rolls = 0
         if bits >= 500:
             number_of_rolls = bits // 500
-        if not self.gacha_handler:
-            self.gacha_handler = get_reference("GachaHandler")
+        bits_toward_next_pull = bits % 500
 
-        if not await self.online_database.user_exists(user_id):
-            debug_print("CustomBuilder", f"User ID: {user_id} does not exist in the database. Creating user entry.")
-            data = {"twitch_username": payload.user.name, "twitch_display_name": payload.user.display_name, "active_gacha_set": "humble beginnings"}
-            await self.online_database.create_user(user_id, data)
-        if await get_setting("Gacha System Enabled", False):
-            if number_of_rolls > 0:
-                if self.gacha_handler:
-                    await self._refresh_browser_overlays()
-                    gacha_task = asyncio.create_task(self.gacha_handler.roll_for_gacha(twitch_user_id=payload.user.id, twitch_display_name=payload.user.display_name, num_pulls=number_of_rolls, bits_toward_next_pull=bits % 500))
-        if not self.online_database:
-            self.online_database = get_reference("OnlineDatabase")
-        user_data = await self.online_database.get_specific_user_data(twitch_user_id=user_id, field="bits_donated")
+        # One read tells us both whether the user exists and what they had donated before this cheer.
+        user_row = await self.online_database.get_user_data(user_id)
+        previous_bits = user_row.get("bits_donated") if user_row else None
         override = False
-        if user_data in [0, None]:
-            if not self.twitch_bot:
-                self.twitch_bot = get_reference("TwitchBot")
+        if previous_bits in [0, None]:
+            # Nothing on record yet; seed it with Twitch's lifetime total when that is larger.
             temp_bits = await self.twitch_bot.get_total_bits_donated(user_id=user_id)
             if temp_bits and temp_bits > 0 and temp_bits > bits:
                 bits = temp_bits
                 override = True
-        if override:
-            await self.online_database.create_user(user_id, {"bits_donated": bits})
+        # Exactly one write per cheer: insert new users with their total, overwrite on override, else add.
+        if user_row is None:
+            debug_print("CustomBuilder", f"User ID: {user_id} does not exist in the database. Creating user entry.")
+            data = {"twitch_username": payload.user.name, "twitch_display_name": payload.user.display_name, "active_gacha_set": "humble beginnings", "bits_donated": bits}
+            await self.online_database.create_user(user_id, data)
+        elif override:
+            await self.online_database.update_user_data(user_id, {"bits_donated": bits})
         else:
             await self.online_database.increment_column(table="users", column_filter="twitch_id", value=user_id, column_to_increment="bits_donated", increment_by=bits)
-        custom_reward = await get_bit_reward(bits)
+        if await cached_get_setting("Gacha System Enabled", False):
+            if number_of_rolls > 0:
+                if self.gacha_handler:
+                    await self._refresh_browser_overlays()
+                    gacha_task = asyncio.create_task(self.gacha_handler.roll_for_gacha(twitch_user_id=payload.user.id, twitch_display_name=payload.user.display_name, num_pulls=number_of_rolls, bits_toward_next_pull=bits_toward_next_pull))
+        custom_reward = (await get_reward_index()).bit_reward(bits)
         if not custom_reward:
             #Fallback: Uses default customizable cheer response
             event = {"type": "cheer", "user": payload.user.display_name, "event": payload}
-            if not self.assistant:
-                self.assistant = get_reference("AssistantManager")
             await asyncio.create_task(self.assistant.generate_voiced_response(event))
             if gacha_task:
                 if isinstance(gacha_task, asyncio.Task):
@@ -1013,8 +1386,6 @@ class CustomEventBuilder():
                 "user_input_raw": raw_user_input,
                 "event_type": f"cheer of {bits} bits from {payload.user.display_name}"
             }
-            if not self.event_manager:
-                self.event_manager = get_reference("EventManager")
             try:
                 await self.run_custom_redemption(event, execute=False)
             except Exception as precache_err:
@@ -1030,6 +1401,46 @@ class CustomEventBuilder():
             print(f"handle_cheer error: {e}")
         return
     
+    async def _prefetch_generations(self, parsed: list, event: dict, payload, fallback_user_input) -> None:
+        """Generate every PREEXECUTION_TOKENS asset of a redemption concurrently.
+
+        Each generator stores its result in event['_generated_assets'] under its cache key,
+        so the later execute pass only plays what is already there. Independent steps
+        (TTS, GPT, meme, sound FX decode) overlap instead of running one after another.
+        """
+        jobs = []
+        for entry in parsed:
+            if not entry:
+                continue
+            if "step" in entry or "token" in entry:
+                token = entry.get("token")
+                if not self._token_needs_generation(token):
+                    continue
+                inp = entry.get("input")
+                if entry.get("_needs_build"):
+                    inp = await self._build_event_string(event, payload, inp)
+                jobs.append((entry.get("step"), inp, token, entry.get("cache_key")))
+                continue
+            jobs.extend(spec for spec in entry.get("_specs", ()) if self._token_needs_generation(spec.token))
+
+        async def _generate(method, inp, token, cache_key):
+            final_inp = _resolve_user_value(inp, payload, fallback_user_input)
+            try:
+                await self._invoke_method(
+                    method,
+                    final_inp,
+                    payload,
+                    event=event,
+                    execute=False,
+                    cache_key=cache_key,
+                    token=token,
+                )
+            except Exception as e:
+                debug_print("CustomBuilder", f"Pre-generation of {token} step failed: {e}")
+
+        if jobs:
+            await asyncio.gather(*(_generate(*job) for job in jobs))
+
     async def run_custom_redemption(self, event: dict, execute: bool = True):
         """Execute a custom redemption using a pre-parsed list of methods.
 
@@ -1043,11 +1454,11 @@ class CustomEventBuilder():
 
         Each item in 'parsed_methods' is expected to be either:
           - {'step': method_ref, 'input': value}
-        or a parallel group with numbered keys:
-          - {'step1': method_ref1, 'input1': v1, 'step2': method_ref2, 'input2': v2, ...}
+        or a parallel group of bound step specs:
+          - {'_group': _CompiledGroup, '_specs': (_StepSpec, ...), '_contains_chat': bool}
 
-        This function will run sequential steps in-order and run numbered groups
-        concurrently.
+        This function will run sequential steps in-order and run the steps of a
+        group concurrently.
         """
         builder = self
         prepare_only = not execute
@@ -1062,27 +1473,34 @@ class CustomEventBuilder():
 
             if not parsed:
                 return
+            # Voice steps play through the assistant; resolve it once for every step below.
+            self._resolve_managers("assistant")
+
+            if prepare_only:
+                await self._prefetch_generations(parsed, event, payload, fallback_user_input)
+                return
 
             chat_buffer_seconds = CHAT_MESSAGE_BUFFER_SECONDS if execute else 0.0
+            buffer_chat = chat_buffer_seconds > 0
             last_step_was_chat = False
+            # Read from OBS at most once per redemption, by the first group that syncs audio to media.
+            fade_delay = None
 
             for entry in parsed:
                 if not entry:
                     continue
-                contains_chat = self._entry_contains_chat_token(entry)
-                if execute and contains_chat and last_step_was_chat and chat_buffer_seconds > 0:
+                # Worked out per code by _compile_plan.
+                contains_chat = entry.get("_contains_chat", False)
+                if buffer_chat and contains_chat and last_step_was_chat:
                     await asyncio.sleep(chat_buffer_seconds)
-                # detect numbered (parallel) group keys
-                numbered = [k for k in entry.keys() if k.startswith("step")]
-                if len(numbered) <= 1:
+                group = entry.get("_group")
+                if group is None:
                     method = entry.get("step")
                     inp = entry.get("input")
-                    if isinstance(inp, str) and "%" in inp:
-                        inp = await builder.string_builder(payload, inp)
+                    if entry.get("_needs_build"):
+                        inp = await builder._build_event_string(event, payload, inp)
                     token = entry.get("token")
                     cache_key = entry.get("cache_key")
-                    if prepare_only and not self._token_needs_generation(token):
-                        continue
                     final_inp = _resolve_user_value(inp, payload, fallback_user_input)
 
                     try:
@@ -1098,135 +1516,72 @@ class CustomEventBuilder():
                     except Exception:
                         pass
                 else:
-                    # run numbered steps concurrently
-                    count = max((int(k.replace("step", "")) for k in numbered), default=0)
-                    tasks = []
-                    gm_cache_keys: list[str] = []
-                    voice_durations: list[float] = []
-                    audio_cache_keys: list[str] = []
-                    display_cache_keys: list[str] = []
-                    entry_specs: list[dict] = []
-
-                    for i in range(1, count + 1):
-                        method = entry.get(f"step{i}")
-                        a = entry.get(f"input{i}")
-                        token = entry.get(f"token{i}")
-                        cache_key = entry.get(f"cache_key{i}")
-                        if prepare_only and not self._token_needs_generation(token):
-                            continue
-
-                        if isinstance(token, str):
-                            upper_tok = token.upper()
-                            if upper_tok in DISPLAY_MEDIA_TOKENS and cache_key:
-                                display_cache_keys.append(cache_key)
-                            if upper_tok == "GM" and cache_key:
-                                gm_cache_keys.append(cache_key)
-                            if upper_tok in VOICE_TOKENS:
-                                duration_val = self._voice_duration_for_cache(event, cache_key)
-                                if duration_val:
-                                    voice_durations.append(duration_val)
-                            if upper_tok in AUDIO_TOKENS and cache_key:
-                                audio_cache_keys.append(cache_key)
-
-                        entry_specs.append(
-                            {
-                                "method": method,
-                                "input": a,
-                                "token": token,
-                                "cache_key": cache_key,
-                            }
-                        )
-
-                    def _parallel_priority(spec: dict) -> int:
-                        tok = spec.get("token")
-                        if isinstance(tok, str):
-                            upper_tok = tok.upper()
-                            if upper_tok in AUDIO_TOKENS:
-                                return 0
-                            if upper_tok in DISPLAY_MEDIA_TOKENS:
-                                return 1
-                        return 2
-
-                    entry_specs.sort(key=_parallel_priority)
-
-                    ready_event = None
-                    display_ready_map = None
-                    audio_wait_map = None
-                    if (
-                        event
-                        and display_cache_keys
-                        and audio_cache_keys
-                    ):
+                    # run the group's steps concurrently; buckets were sorted out at compile time
+                    specs = entry["_specs"]
+                    audio_specs = [specs[i] for i in group.audio_idx]
+                    voice_specs = [specs[i] for i in group.voice_idx]
+                    display_specs = [specs[i] for i in group.display_idx]
+                    other_specs = [specs[i] for i in group.other_idx]
+
+                    audio_cache_keys = [spec.cache_key for spec in audio_specs]
+                    display_cache_keys = [spec.cache_key for spec in display_specs]
+                    gm_cache_keys = [spec.cache_key for spec in display_specs if spec.token == "GM"]
+                    voice_durations = [
+                        duration
+                        for spec in voice_specs
+                        if (duration := self._voice_duration_for_cache(event, spec.cache_key))
+                    ]
+
+                    # Hint maps are only created when the group has keys that need them.
+                    if event and display_cache_keys and audio_cache_keys:
                         ready_event = asyncio.Event()
-                        display_ready_map = event.setdefault("_display_ready_events", {})
-                        audio_wait_map = event.setdefault("_audio_wait_events", {})
-                        for ck in display_cache_keys:
-                            display_ready_map[ck] = ready_event
-                        for ck in audio_cache_keys:
-                            audio_wait_map[ck] = ready_event
-
-                    audio_specs: list[dict] = []
-                    voice_specs: list[dict] = []
-                    display_specs: list[dict] = []
-                    other_specs: list[dict] = []
-
-                    for spec in entry_specs:
-                        tok_upper = spec.get("token")
-                        if isinstance(tok_upper, str):
-                            tok_upper = tok_upper.upper()
-                        if tok_upper in AUDIO_TOKENS:
-                            audio_specs.append(spec)
-                        elif tok_upper in VOICE_TOKENS:
-                            voice_specs.append(spec)
-                        elif tok_upper in DISPLAY_MEDIA_TOKENS:
-                            display_specs.append(spec)
-                        else:
-                            other_specs.append(spec)
-
-                    async def _invoke_spec(spec: dict):
-                        m = spec.get("method")
-                        a = spec.get("input")
-                        tok = spec.get("token")
-                        ck = spec.get("cache_key")
-                        final = _resolve_user_value(a, payload, fallback_user_input)
+                        event.setdefault("_display_ready_events", {}).update(dict.fromkeys(display_cache_keys, ready_event))
+                        event.setdefault("_audio_wait_events", {}).update(dict.fromkeys(audio_cache_keys, ready_event))
+                        if fade_delay is None:
+                            fade_delay = self._display_fade_in_delay()
+                        if fade_delay and fade_delay > 0:
+                            half_delay = max(0.0, fade_delay * 0.5)
+                            event.setdefault("_audio_delay_hints", {}).update(dict.fromkeys(audio_cache_keys, half_delay))
+
+                    if event and voice_durations and gm_cache_keys:
+                        duration_hint = max(voice_durations)
+                        event.setdefault("_meme_duration_hints", {}).update(dict.fromkeys(gm_cache_keys, duration_hint))
+
+                    async def _invoke_spec(spec: _StepSpec):
+                        final = _resolve_user_value(spec.input, payload, fallback_user_input)
                         try:
                             return await builder._invoke_method(
-                                m,
+                                spec.method,
                                 final,
                                 payload,
                                 event=event,
                                 execute=execute,
-                                cache_key=ck,
-                                token=tok,
+                                cache_key=spec.cache_key,
+                                token=spec.token,
                             )
                         except Exception:
                             return None
 
-                    async def _run_specs_serial(specs: list[dict]):
+                    async def _invoke_spec_bounded(spec: _StepSpec):
+                        async with self._other_step_semaphore:
+                            return await _invoke_spec(spec)
+
+                    async def _run_specs_serial(specs: list[_StepSpec]):
                         for spec in specs:
                             await _invoke_spec(spec)
 
-                    async def _run_specs_parallel(specs: list[dict]):
-                        tasks = [asyncio.create_task(_invoke_spec(spec)) for spec in specs]
-                        if tasks:
-                            await asyncio.gather(*tasks, return_exceptions=True)
-
-                    if event and voice_durations and gm_cache_keys:
-                        duration_hint = max(voice_durations)
-                        duration_map = event.setdefault("_meme_duration_hints", {})
-                        for ck in gm_cache_keys:
-                            if ck:
-                                duration_map[ck] = duration_hint
+                    async def _run_specs_parallel(specs: list[_StepSpec], invoke=_invoke_spec):
+                        # _invoke_spec swallows step errors, so one step never cancels its siblings.
+                        async with asyncio.TaskGroup() as tg:
+                            for spec in specs:
+                                tg.create_task(invoke(spec))
 
-                    if event and display_cache_keys and audio_cache_keys:
-                        fade_delay = self._display_fade_in_delay()
-                        if fade_delay and fade_delay > 0:
-                            half_delay = max(0.0, fade_delay * 0.5)
-                            delay_map = event.setdefault("_audio_delay_hints", {})
-                            for ck in audio_cache_keys:
-                                if not ck:
-                                    continue
-                                delay_map[ck] = half_delay
+                    # Unordered steps don't wait on the audio/voice/display staggers below.
+                    other_task = (
+                        asyncio.create_task(_run_specs_parallel(other_specs, _invoke_spec_bounded))
+                        if other_specs
+                        else None
+                    )
 
                     if (
                         not audio_specs
@@ -1239,6 +1594,12 @@ class CustomEventBuilder():
                         display_specs = []
 
                     if audio_specs:
+                        # Staggers count from when audio starts, so time spent starting it
+                        # (and then the voices) is taken out of the waits rather than added to them.
+                        loop = asyncio.get_running_loop()
+                        audio_started = loop.time()
+                        voice_deadline = audio_started + SIMULTANEOUS_VOICE_STAGGER_SECONDS
+                        display_deadline = (voice_deadline if voice_specs else audio_started) + SIMULTANEOUS_MEDIA_STAGGER_SECONDS
                         await _run_specs_serial(audio_specs)
 
                     if (
@@ -1252,7 +1613,7 @@ class CustomEventBuilder():
                             "Staggering voice start by "
                             f"{SIMULTANEOUS_VOICE_STAGGER_SECONDS:.2f}s after audio",
                         )
-                        await asyncio.sleep(SIMULTANEOUS_VOICE_STAGGER_SECONDS)
+                        await asyncio.sleep(max(0.0, voice_deadline - loop.time()))
 
                     if voice_specs:
                         if audio_specs:
@@ -1271,13 +1632,23 @@ class CustomEventBuilder():
                             "Staggering display start by "
                             f"{SIMULTANEOUS_MEDIA_STAGGER_SECONDS:.2f}s after audio",
                         )
-                        await asyncio.sleep(SIMULTANEOUS_MEDIA_STAGGER_SECONDS)
+                        await asyncio.sleep(max(0.0, display_deadline - loop.time()))
 
                     if display_specs:
-                        await _run_specs_serial(display_specs)
+                        # display_meme drives one OBS source per token (GM: meme object, AN: GIF
+                        # placeholder), so same-token displays stay serial; different sources overlap.
+                        by_source: dict[str, list[_StepSpec]] = {}
+                        for spec in display_specs:
+                            by_source.setdefault(spec.token, []).append(spec)
+                        if len(by_source) == 1:
+                            await _run_specs_serial(display_specs)
+                        else:
+                            async with asyncio.TaskGroup() as tg:
+                                for specs in by_source.values():
+                                    tg.create_task(_run_specs_serial(specs))
 
-                    if other_specs:
-                        await _run_specs_parallel(other_specs)
+                    if other_task is not None:
+                        await other_task
 
                 if execute:
                     last_step_was_chat = contains_chat
@@ -1287,6 +1658,17 @@ class CustomEventBuilder():
             print(f"run_custom_redemption error: {e}")
             return
     
+    async def _build_event_string(self, event: dict, payload, text: str) -> str:
+        """string_builder memoized per event, so the prepare and execute passes expand a text once."""
+        built = event.setdefault("_built_strings", {})
+        try:
+            return built[text]
+        except KeyError:
+            pass
+        result = await self.string_builder(payload, text)
+        built[text] = result
+        return result
+
     async def string_builder(self, payload, text: str) -> str:
         # %bot% - bot's display name
         # %user% - user's display name
@@ -1302,105 +1684,60 @@ class CustomEventBuilder():
         # %rng% for totally random number
         # %rng:min-max% for random number between min and max (inclusive)
         debug_print("CommandHandler", f"Building text for: {text}")
-        updated_text = text
-        if "%" in updated_text:
-            if "%bot%" in updated_text:
-                try:
-                    if not self.twitch_bot:
-                        self.twitch_bot = get_reference("TwitchBot")
-                    updated_text = updated_text.replace("%bot%", self.twitch_bot.user.name.capitalize())
-                except Exception:
-                    pass
-            if "%user%" in updated_text:
-                try:
-                    updated_text = updated_text.replace("%user%", payload.user.display_name.capitalize())
-                except Exception:
-                    pass
-            if "%channel%" in updated_text:
-                try:
-                    updated_text = updated_text.replace("%channel%", payload.broadcaster.display_name.capitalize())
-                except Exception:
-                    pass
-            if "%reward%" in updated_text:
-                try:
-                    updated_text = updated_text.replace("%reward%", payload.reward.title)
-                except Exception:
-                    pass
-            if "%viewers%" in updated_text:
-                try:
-                    if not self.twitch_bot:
-                        self.twitch_bot = get_reference("TwitchBot")
-                    viewers = await self.twitch_bot.fetch_viewer_count()
-                    updated_text = updated_text.replace("%viewers%", str(viewers))
-                except Exception:
-                    pass
-            if "%followers%" in updated_text:
-                try:
-                    if not self.twitch_bot:
-                        self.twitch_bot = get_reference("TwitchBot")
-                    followers = await self.twitch_bot.fetch_follower_count()
-                    updated_text = updated_text.replace("%followers%", str(followers))
-                except Exception:
-                    pass
-            if "%subscribers%" in updated_text:
-                try:
-                    if not self.twitch_bot:
-                        self.twitch_bot = get_reference("TwitchBot")
-                    subscribers = await self.twitch_bot.fetch_subscriber_count()
-                    updated_text = updated_text.replace("%subscribers%", str(subscribers))
-                except Exception:
-                    pass
-            if "%title%" in updated_text:
-                try:
-                    if not self.twitch_bot:
-                        self.twitch_bot = get_reference("TwitchBot")
-                    title = await self.twitch_bot.fetch_title()
-                    updated_text = updated_text.replace("%title%", title)
-                except Exception:
-                    pass
-            if "%game%" in updated_text:
-                try:
-                    if not self.twitch_bot:
-                        self.twitch_bot = get_reference("TwitchBot")
-                    game = await self.twitch_bot.get_current_game()
-                    updated_text = updated_text.replace("%game%", game)
-                except Exception:
-                    pass
-            if "%message%" in updated_text:
-                try:
-                    message = payload.user_input
-                    updated_text = updated_text.replace("%message%", message)
-                except Exception:
-                    pass
-            if "%bits%" in updated_text:
-                try:
-                    bits = str(payload.bits)
-                    updated_text = updated_text.replace("%bits%", bits)
-                except Exception:
-                    pass
-            if "%rng%" in updated_text:
-                try:
-                    while "%rng%" in updated_text:
-                        rand_num = get_random_number(0, 100)
-                        updated_text = updated_text.replace("%rng%", str(rand_num), 1)
-                except Exception:
-                    pass
-            if "%rng:" in updated_text:
-                try:
-                    import re
-                    pattern = r"%rng:(-?\d+)-(-?\d+)%"
-                    matches = re.findall(pattern, updated_text)
-                    for match in matches:
-                        min_val = int(match[0])
-                        max_val = int(match[1])
-                        if min_val > max_val:
-                            min_val, max_val = max_val, min_val
-                        rand_num = get_random_number(min_val, max_val)
-                        updated_text = re.sub(r"%rng:{}-{}%".format(match[0], match[1]), str(rand_num), updated_text, count=1)
-                except Exception:
-                    pass
-
-        return updated_text
+        if "%" not in text:
+            return text
+        needed = {match.group(1) for match in _PLACEHOLDER_RE.finditer(text)} - {None, "rng"}
+
+        resolvers = {
+            "bot": lambda: self._ensure_twitch_bot().user.name.capitalize(),
+            "user": lambda: payload.user.display_name.capitalize(),
+            "channel": lambda: payload.broadcaster.display_name.capitalize(),
+            "reward": lambda: payload.reward.title,
+            "viewers": lambda: self._ensure_twitch_bot().fetch_viewer_count(),
+            "followers": lambda: self._ensure_twitch_bot().fetch_follower_count(),
+            "subscribers": lambda: self._ensure_twitch_bot().fetch_subscriber_count(),
+            "title": lambda: self._ensure_twitch_bot().fetch_title(),
+            "game": lambda: self._ensure_twitch_bot().get_current_game(),
+            "message": lambda: payload.user_input,
+            "bits": lambda: payload.bits,
+        }
+
+        async def _resolve(name: str):
+            try:
+                value = resolvers[name]()
+                if inspect.isawaitable(value):
+                    value = await value
+            except Exception:
+                return name, None
+            return name, value
+
+        # Each distinct placeholder is looked up once (Twitch API lookups concurrently);
+        # ones that fail are left in the text untouched.
+        values = {
+            name: str(value)
+            for name, value in await asyncio.gather(*(_resolve(name) for name in needed))
+            if value is not None
+        }
+
+        def _substitute(match) -> str:
+            name = match.group(1)
+            if name is None:
+                min_val = int(match.group(2))
+                max_val = int(match.group(3))
+                if min_val > max_val:
+                    min_val, max_val = max_val, min_val
+                return str(get_random_number(min_val, max_val))
+            if name == "rng":
+                return str(get_random_number(0, 100))
+            return values.get(name, match.group(0))
+
+        # One pass over the text; substituted values are never re-scanned for placeholders.
+        return _PLACEHOLDER_RE.sub(_substitute, text)
+
+    def _ensure_twitch_bot(self):
+        if not self.twitch_bot:
+            self.twitch_bot = get_reference("TwitchBot")
+        return self.twitch_bot
 
     async def get_action_method(self, method_code: str, index: int):
         """Maps method codes to actual functions."""
@@ -1655,8 +1992,8 @@ class CustomEventBuilder():
                     ready_opacity = 0.5
         cache = self._get_cached_asset(event, cache_key)
         if cache is None:
-            self.memes_dir.mkdir(exist_ok=True)
-            self.screenshots_dir.mkdir(exist_ok=True)
+            self.memes_dir.mkdir(parents=True, exist_ok=True)
+            self.screenshots_dir.mkdir(parents=True, exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = self.screenshots_dir / f"meme_screenshot_{timestamp}.png"
             output_path = self.obs_manager.get_obs_screenshot(output_path)
@@ -1664,8 +2001,8 @@ class CustomEventBuilder():
                 self.chatGPT = get_reference("GPTManager")
             chatGPT = asyncio.to_thread(self.chatGPT.analyze_image, image_path=output_path, is_meme=True)
             response = await chatGPT
-            caption_match = re.search(r'!caption\s*(.*?)\s*(?=!font|$)', response, re.DOTALL | re.IGNORECASE)
-            font_match = re.search(r'!font\s*(.*?)\s*(?=!caption|$)', response, re.DOTALL | re.IGNORECASE)
+            caption_match = MEME_CAPTION_RE.search(response)
+            font_match = MEME_FONT_RE.search(response)
             parsed_caption = caption_match.group(1).strip() if caption_match else ""
             parsed_font = font_match.group(1).strip() if font_match else None
             output_path = make_meme(output_path, parsed_caption, parsed_font)
@@ -1804,7 +2141,7 @@ class CustomEventBuilder():
         debug_print("CustomBuilder", f"Animating onscreen element: {file_name}")
         if not execute:
             return None
-        self.images_and_gifs_dir.mkdir(exist_ok=True)
+        self.images_and_gifs_dir.mkdir(parents=True, exist_ok=True)
         file_path = self.images_and_gifs_dir / file_name
         if not self.obs_manager:
             self.obs_manager = get_reference("OBSManager")
@@ -1,6 +1,8 @@
 from typing import Any, Tuple, List, Literal
 import asyncio
+import bisect
 import threading
+import time
 import asqlite
 from twitchio import eventsub
 from tools import debug_print
@@ -565,6 +567,29 @@ async def get_setting(key: str, default: Any = None) -> Any:
             raise
     return default
 
+# How long cached_get_setting trusts a value before reading the settings table again.
+SETTING_CACHE_TTL_SECONDS = 60.0
+# key -> (monotonic time fetched, value or _SETTING_MISSING)
+_SETTING_CACHE: dict[str, tuple[float, Any]] = {}
+_SETTING_MISSING = object()
+
+async def cached_get_setting(key: str, default: Any = None) -> Any:
+    """get_setting for hot paths: reuses a value read within the last SETTING_CACHE_TTL_SECONDS."""
+    now = time.monotonic()
+    cached = _SETTING_CACHE.get(key)
+    if cached is None or now - cached[0] >= SETTING_CACHE_TTL_SECONDS:
+        value = await get_setting(key, _SETTING_MISSING)
+        cached = (now, value)
+        _SETTING_CACHE[key] = cached
+    return default if cached[1] is _SETTING_MISSING else cached[1]
+
+def invalidate_setting(key: str | None = None) -> None:
+    """Drop a cached setting (or all of them) after it is written, so readers see it immediately."""
+    if key is None:
+        _SETTING_CACHE.clear()
+    else:
+        _SETTING_CACHE.pop(key, None)
+
 async def get_hotkey(action: str, default: str = "null") -> str:
     """Get a hotkey keybind by action, returning default if not found."""
     debug_print("Database", f"Fetching hotkey for action '{action}'.")
@@ -880,6 +905,55 @@ async def add_custom_reward(reward_type: str, name: str, description: str, code:
             (reward_type, bit_threshold, name, description, code, is_enabled, *padded_inputs)
         )
         await connection.commit()
+    invalidate_reward_index()
+
+class RewardIndex:
+    """Enabled custom rewards held in memory, answering what get_custom_reward/get_bit_reward would."""
+
+    def __init__(self, rows: List[dict]):
+        # (name, redemption_type) -> row; the first row by id wins, as with the SQL lookup
+        self.by_name: dict[tuple[str, str], dict] = {}
+        bit_tiers: list[tuple[int, dict]] = []
+        for row in rows:
+            self.by_name.setdefault((row["name"], row["redemption_type"]), row)
+            if row["redemption_type"] == "bits" and row["bit_threshold"] is not None:
+                bit_tiers.append((row["bit_threshold"], row))
+        bit_tiers.sort(key=lambda tier: tier[0])
+        self.bit_thresholds = [threshold for threshold, _ in bit_tiers]
+        self.bit_rewards = [row for _, row in bit_tiers]
+
+    def custom_reward(self, reward_name: str, reward_type: str) -> dict | None:
+        return self.by_name.get((reward_name, reward_type))
+
+    def bit_reward(self, threshold: int) -> dict:
+        """Highest enabled bit reward whose bit_threshold is <= threshold, or {}."""
+        position = bisect.bisect_right(self.bit_thresholds, threshold)
+        return self.bit_rewards[position - 1] if position else {}
+
+_REWARD_INDEX: RewardIndex | None = None
+# Bumped by invalidate_reward_index so a load that raced a write isn't kept.
+_REWARD_INDEX_VERSION = 0
+
+async def get_reward_index() -> RewardIndex:
+    """The in-memory reward index, loading every enabled reward in one query on first use."""
+    global _REWARD_INDEX
+    index = _REWARD_INDEX
+    if index is None:
+        version = _REWARD_INDEX_VERSION
+        debug_print("Database", "Loading enabled custom rewards into the reward index.")
+        async with DATABASE.acquire() as connection:
+            cursor = await connection.execute("SELECT * FROM custom_rewards WHERE is_enabled = 1 ORDER BY id")
+            rows = await cursor.fetchall()
+        index = RewardIndex([dict(row) for row in rows])
+        if version == _REWARD_INDEX_VERSION:
+            _REWARD_INDEX = index
+    return index
+
+def invalidate_reward_index() -> None:
+    """Call after any write to custom_rewards so the next lookup reloads them."""
+    global _REWARD_INDEX, _REWARD_INDEX_VERSION
+    _REWARD_INDEX_VERSION += 1
+    _REWARD_INDEX = None
 
 async def get_bit_reward(threshold: int) -> dict:
     """Retrieve highest bit reward for threshold."""
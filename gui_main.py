@@ -20,6 +20,8 @@ from dotenv import load_dotenv
 from db import (
     save_location_capture,
     get_setting,
+    invalidate_setting,
+    invalidate_reward_index,
     get_hotkey,
     set_hotkey,
     close_database_sync,
@@ -119,7 +121,6 @@ from hotkey_listener import GlobalHotkeyListener, set_global_listener, get_globa
 DB_FILENAME = str(path_from_app_root("data", "maddieply.db"))
 ELEVEN_LABS_VOICE_MODELS = ["eleven_v3", "eleven_multilingual_v2", "eleven_flash_v2_5", "eleven_flash_v2", "eleven_turbo_v2_5", "eleven_turbo_v2"]
 ELEVEN_LABS_VOICES = []
-AUDIO_DEVICES = []
 AZURE_TTS_VOICES = ["en-US-AvaNeural", "en-US-EmmaNeural", "en-US-JennyNeural", "en-US-AriaNeural", "en-US-JaneNeural", "en-US-LunaNeural", "en-US-SaraNeural", "en-US-NancyNeural", "en-US-AmberNeural", "en-US-AnaNeural", "en-US-AshleyNeural", "en-US-CoraNeural", "en-US-ElizabethNeural", "en-US-MichelleNeural", "en-US-AvaMultilingualNeural", "en-US-MonicaNeural", "en-US-BlueNeural", "en-US-AmandaMultilingualNeural", "en-US-LolaMultilingualNeural", "en-US-NancyMultilingualNeural", "en-US-ShimmerTurboMultilingualNeural", "en-US-SerenaMultilingualNeural", "en-US-PhoebeMultilingualNeural", "en-US-NovaTurboMultilingualNeural", "en-US-EvelynMultilingualNeural", "en-US-JennyMultilingualNeural", "en-US-EmmaMultilingualNeural", "en-US-CoraMultilingualNeural", "en-US-Aria:DragonHDLatestNeural", "en-US-Ava:DragonHDLatestNeural", "en-US-Emma:DragonHDLatestNeural", "en-US-Emma2:DragonHDLatestNeural", "en-US-Jenny:DragonHDLatestNeural"]
 GPT_MODELS = ['gpt-4o']
 CUSTOM_BUILDER = [
@@ -477,10 +478,7 @@ class DBEditor(tk.Tk):
                 devices = audio_manager.list_output_devices()
             except Exception:
                 devices = []
-            if devices:
-                AUDIO_DEVICES.clear()
-                AUDIO_DEVICES.extend(devices)
-            debug_print("GUI", f"Discovered audio devices: {AUDIO_DEVICES}")
+            debug_print("GUI", f"Discovered audio devices: {devices}")
         except Exception as e:
             debug_print("GUI", f"Error listing audio devices: {e}", "ERROR")
 
@@ -1193,7 +1191,8 @@ class DBEditor(tk.Tk):
                     for ev in getattr(evm, "event_queue", []):
                         name = ev.get("event_type") if isinstance(ev, dict) else str(ev)
                         queued_list.insert(tk.END, name)
-                    for ev in getattr(evm, "played_events", []):
+                    # Snapshot: played_events is a bounded deque mutated on the bot loop.
+                    for ev in list(getattr(evm, "played_events", [])):
                         name = ev.get("event_type") if isinstance(ev, dict) else str(ev)
                         played_list.insert(tk.END, name)
                     self._apply_listbox_stripes(queued_list)
@@ -2521,6 +2520,7 @@ class DBEditor(tk.Tk):
                         vals = [redemption_type, bt_val, name, description, code_str] + inputs_flat + [int(target_id)]
                         conn.execute(f"UPDATE custom_rewards SET {', '.join(set_parts)} WHERE id = ?", tuple(vals))
                     conn.commit()
+                    invalidate_reward_index()
                 except Exception as e:
                     messagebox.showerror("DB", f"Failed to save: {e}", parent=dlg)
                 finally:
@@ -2690,6 +2690,7 @@ class DBEditor(tk.Tk):
                 (key,),
             )
             conn.commit()
+            invalidate_setting(key)
             debug_print("GUI", f"Automatically disabled '{key}': {reason}", "ERROR")
         except sqlite3.Error as exc:
             debug_print("GUI", f"Unable to disable '{key}': {exc}", "ERROR")
@@ -3158,6 +3159,7 @@ class DBEditor(tk.Tk):
                     q = ",".join(["?"] * len(to_disable))
                     conn.execute(f"UPDATE custom_rewards SET is_enabled = 0 WHERE id IN ({q})", tuple(to_disable))
                     conn.commit()
+                    invalidate_reward_index()
                     # reflect in local list
                     for r in bits_rows:
                         if r.get("id") in to_disable:
@@ -3312,6 +3314,7 @@ class DBEditor(tk.Tk):
                     except Exception as e:
                         debug_print("GUI", f"Error deleting custom redemption: {e}", "ERROR")
                 conn.commit()
+                invalidate_reward_index()
             except Exception as e:
                 messagebox.showerror("DB", f"Failed to delete redemption(s): {e}", parent=self)
             finally:
@@ -3437,6 +3440,7 @@ class DBEditor(tk.Tk):
                     except Exception:
                         pass
                 conn.commit()
+                invalidate_reward_index()
             except Exception as e:
                 messagebox.showerror("DB", f"Failed to toggle enabled state: {e}", parent=self)
             finally:
@@ -4589,7 +4593,7 @@ class DBEditor(tk.Tk):
         combobox_map = {
             "Elevenlabs Synthesizer Model": ELEVEN_LABS_VOICE_MODELS,
             "Azure TTS Backup Voice": AZURE_TTS_VOICES,
-            "Audio Output Device": AUDIO_DEVICES,
+            "Audio Output Device": self._get_audio_device_choices(),
             "Default OpenAI Model": openai_models,
             "Subtitles Style": list(SubtitleOverlayServer.sub_styles),
         }
@@ -4935,6 +4939,15 @@ class DBEditor(tk.Tk):
         if key.startswith("Shared Chat"):
             self._refresh_shared_chat_settings_async()
 
+        if key.startswith(("Maximum Chat Response", "Minimum Chat Response")):
+            try:
+                timer = get_reference("ResponseTimer")
+            except Exception:
+                timer = None
+            if timer is not None:
+                timer.invalidate_settings()
+            return
+
         if key == "Chat Response Enabled":
             try:
                 start_timer_manager_in_background()
@@ -5089,6 +5102,14 @@ class DBEditor(tk.Tk):
         if not self._schedule_async_task(coro, "SharedChatSettings"):
             debug_print("GUI", "Unable to schedule shared chat settings update; bot loop not ready.", "ERROR")
 
+    def _get_audio_device_choices(self) -> list[str]:
+        """Return the AudioManager's last enumerated output devices."""
+        try:
+            return list(get_reference("AudioManager").audio_devices)
+        except Exception as exc:
+            debug_print("GUI", f"Failed to access AudioManager for device list: {exc}", "ERROR")
+            return []
+
     def _get_openai_model_choices(self) -> list[str]:
         """Return cached OpenAI model ids, fetching from GPTManager if needed."""
         if self._openai_model_choices is not None:
@@ -5131,6 +5152,7 @@ class DBEditor(tk.Tk):
             conn.commit()
         finally:
             conn.close()
+        invalidate_setting(key)
         self._handle_setting_side_effect(key, v)
         # If this was the Debug Mode setting, call set_debug to apply immediately
         try:
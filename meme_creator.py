@@ -1,9 +1,14 @@
 import asyncio
+import re
 from PIL import Image, ImageDraw, ImageFont
 from datetime import datetime
 from light_discord import DiscordBot
 from tools import path_from_app_root
 
+# Pull the caption and font out of a meme-analysis response ("!caption ... !font ..." in either order).
+MEME_CAPTION_RE = re.compile(r"!caption\s*(.*?)\s*(?=!font|$)", re.DOTALL | re.IGNORECASE)
+MEME_FONT_RE = re.compile(r"!font\s*(.*?)\s*(?=!caption|$)", re.DOTALL | re.IGNORECASE)
+
 #Move center cropping of image to here and save as a temp png
 def center_crop_image(input_img_path: str, output_img_path: str) -> str:
     img = Image.open(input_img_path)
@@ -171,7 +176,6 @@ def make_meme(input_img_path: str, caption: str, font: str) -> str:
 
 # Example:
 if __name__ == "__main__":
-    import re
     from openai_chat import OpenAiManager
     chatGPT = OpenAiManager()
     discord_bot = DiscordBot()
@@ -179,8 +183,8 @@ if __name__ == "__main__":
     print("Analyzing image for meme caption and font...")
     response = chatGPT.analyze_image("test_image.jpg", True)
     print(response)
-    caption_match = re.search(r'!caption\s*(.*?)\s*(?=!font|$)', response, re.DOTALL | re.IGNORECASE)
-    font_match = re.search(r'!font\s*(.*?)\s*(?=!caption|$)', response, re.DOTALL | re.IGNORECASE)
+    caption_match = MEME_CAPTION_RE.search(response)
+    font_match = MEME_FONT_RE.search(response)
     if caption_match:
         parsed_caption = caption_match.group(1).strip()
         print(f"Parsed Caption: {parsed_caption}")
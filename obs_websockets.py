@@ -496,6 +496,7 @@ class OBSWebsocketsManager:
 
             frame_ms = 50
             num_frames = len(volumes)
+            ys = audio_manager.map_volumes_to_ys(volumes, min_vol, max_vol, actual_base_y)
             start_time = time.perf_counter()
             total_duration_s = total_duration_ms / 1000
 
@@ -505,8 +506,7 @@ class OBSWebsocketsManager:
                     break
 
                 frame_index = int(elapsed * 1000 // frame_ms) % num_frames
-                vol = volumes[frame_index]
-                y = await audio_manager.map_volume_to_y(vol, min_vol, max_vol, actual_base_y)
+                y = float(ys[frame_index])
 
                 await asyncio.to_thread(self.ws.set_scene_item_transform,
                     scene_name,
@@ -1556,14 +1556,13 @@ async def meme_creation_workflow():
     screenshots_dir = media_dir / "screenshots"
     screenshots_dir.mkdir(exist_ok=True)
     manager.get_obs_screenshot(screenshots_dir / "test_screenshot.png")
-    from meme_creator import make_meme
+    from meme_creator import MEME_CAPTION_RE, MEME_FONT_RE, make_meme
     from openai_chat import OpenAiManager
     ai = OpenAiManager()
     screenshot_path = screenshots_dir / "test_screenshot.png"
     response = ai.analyze_image(image_path=screenshot_path, is_meme=True)
-    import re
-    caption_match = re.search(r'!caption\s*(.*?)\s*(?=!font|$)', response, re.DOTALL | re.IGNORECASE)
-    font_match = re.search(r'!font\s*(.*?)\s*(?=!caption|$)', response, re.DOTALL | re.IGNORECASE)
+    caption_match = MEME_CAPTION_RE.search(response)
+    font_match = MEME_FONT_RE.search(response)
     if caption_match:
         parsed_caption = caption_match.group(1).strip()
         print(f"Parsed Caption: {parsed_caption}")
@@ -82,7 +82,9 @@ class OpenAiManager:
         self.default_model = None
         self.fine_tune_model = None
         self.bot_detector_model = None
-        self.assistant = get_reference("AssistantManager")
+        # Resolved on first tool call; looking it up here would build the
+        # AssistantManager, which in turn needs this manager.
+        self.assistant = None
         try:
             self.client = OpenAI(api_key = API_KEY)
         except TypeError:
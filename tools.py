@@ -1,8 +1,9 @@
 import datetime
+import functools
 import random
 import sys
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 DEBUG = False
 _PROJECT_ROOT = Path(__file__).resolve().parent
 TWITCH_BOT = None
@@ -23,6 +24,8 @@ ONLINE_DATABASE = None
 ONLINE_STORAGE = None
 GACHA_HANDLER = None
 GACHA_OVERLAY = None
+_ERROR_ONLY_LOG_MODULES = frozenset({"Database", "GUI", "Tools"})
+_REFERENCE_FACTORIES: dict[str, Callable[[], object]] = {}
 
 def get_debug() -> bool:
     """Fetches the DEBUG setting from the database."""
@@ -40,12 +43,13 @@ def debug_print(module_name: str = None, text: str = None, print_type: str = "No
     if not module_name or not text:
         print("debug_print called without required parameters.")
         return
+    error_only = module_name in _ERROR_ONLY_LOG_MODULES
+    if not DEBUG and error_only and print_type != "ERROR":
+        return
     time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    if text is None:
-        text = "This module forgot to include the module name."
     if DEBUG:
         print(f"[{time}][DEBUG][{module_name}] {text}")
-    if module_name in ["Database", "GUI", "Tools"]:
+    if error_only:
         if print_type == "ERROR":
             append_log_file(f"[{time}][ERROR][{module_name}] {text}")
         else:
@@ -66,8 +70,9 @@ def get_app_root() -> Path:
         return Path(sys.executable).resolve().parent
     return _PROJECT_ROOT
 
+@functools.lru_cache(maxsize=None)
 def path_from_app_root(*parts: str) -> Path:
-    """Join paths relative to the runtime root."""
+    """Join paths relative to the runtime root (memoized; Paths are immutable and the root never moves)."""
     return get_app_root().joinpath(*parts)
 
 def set_reference(name: str, reference) -> None:
@@ -165,8 +170,15 @@ def set_reference(name: str, reference) -> None:
             success = "to None."
     debug_print("Tools", f"{name} reference set {success}")
 
+def register_reference_factory(name: str, factory: Callable[[], object]) -> None:
+    """Registers a getter that lazily builds (and sets) the reference on first request."""
+    _REFERENCE_FACTORIES[name] = factory
+
 def get_reference(name: Literal["TwitchBot", "ResponseTimer", "DiscordBot", "ElevenLabsManager", "SpeechToTextManager", "AssistantManager", "EventManager", "AutoMod", "AudioManager", "OBSManager", "GPTManager", "PointBuilder", "MessageScheduler", "CommandHandler", "OnlineDatabase", "OnlineStorage", "GachaHandler", "GachaOverlay"]):
     """Gets a global reference by name"""
+    factory = _REFERENCE_FACTORIES.get(name)
+    if factory is not None:
+        return factory()
     if name == "TwitchBot":
         if not TWITCH_BOT:
             debug_print("Tools", "TwitchBot reference requested but not set.")
@@ -4,6 +4,7 @@ import twitchio
 import os
 import logging
 import random
+import re
 from dotenv import load_dotenv
 from custom_event_builder import CustomEventBuilder
 from db import setup_database, get_all_commands, get_setting
@@ -20,6 +21,10 @@ from light_discord import DiscordBot
 
 load_dotenv()
 
+# Command placeholders other than %input#%: group 1 is the name, groups 2/3 the %rng:min:max%
+# bounds (either may be negative or the larger one).
+_COMMAND_PLACEHOLDER_RE = re.compile(r"%(bot|user|channel|rng)%|%rng:(-?\d+):(-?\d+)%")
+
 def _sanitize_env_value(value: str) -> str:
     """Trim whitespace and wrapping quotes from .env values."""
     value = value.strip()
@@ -521,12 +526,18 @@ class CommandHandler(commands.Component):
         asyncio.create_task(self.set_shared_chat_settings())
         asyncio.create_task(self.event_manager.start())
         asyncio.create_task(self.start_gacha_system())
+        asyncio.create_task(self.preload_sound_fx())
         debug_print("CommandHandler", "CommandHandler initialized.")
 
     async def start_custom_builder(self) -> None:
         self.custom_builder = CustomEventBuilder()
         set_reference("PointBuilder", self.custom_builder)
 
+    async def preload_sound_fx(self) -> None:
+        if not self.audio_manager:
+            self.audio_manager = get_reference("AudioManager")
+        await self.audio_manager.warm_sound_fx_cache()
+
     async def start_online_database(self) -> None:
         from online_db import OnlineDatabase, OnlineStorage
         OnlineStorage()
@@ -660,7 +671,6 @@ class CommandHandler(commands.Component):
         updated_response = response
         if "%" in updated_response:
             if "%input" in updated_response:
-                import re
                 pattern = r"%input(\d+)%"
                 matches = re.findall(pattern, updated_response)
                 input_args = []
@@ -685,42 +695,37 @@ class CommandHandler(commands.Component):
                             updated_response = updated_response.replace(f"%input{match}%", "")
                     except Exception:
                         pass
-            if "%bot%" in updated_response:
-                try:
-                    updated_response = updated_response.replace("%bot%", self.bot.user.name.capitalize())
-                except Exception:
-                    pass
-            if "%user%" in updated_response:
-                try:
+            # Every other placeholder is expanded in one pass; names are resolved once, on first use.
+            resolved = {}
+
+            def _resolve(name: str) -> str | None:
+                if name == "rng":
+                    # Like the other names, every %rng% in one response shares a roll.
+                    return str(get_random_number(1, 100))
+                if name == "bot":
+                    return self.bot.user.name.capitalize()
+                if name == "user":
                     author = getattr(ctx, "author", None)
-                    if author is not None and hasattr(author, "display_name"):
-                        updated_response = updated_response.replace("%user%", author.display_name)
-                except Exception:
-                    pass
-            if "%channel%" in updated_response:
-                try:
-                    channel = getattr(ctx, "channel", None) or getattr(ctx, "message", None) and getattr(ctx.message, "channel", None)
-                    if channel is not None and hasattr(channel, "name"):
-                        updated_response = updated_response.replace("%channel%", channel.name)
-                except Exception:
-                    pass
-            if "%rng%" in updated_response:
-                random_number = str(get_random_number(1, 100))
-                updated_response = updated_response.replace("%rng%", random_number)
-            if "%rng:" in updated_response:
-                import re
-                pattern = r"%rng:(-?\d+):(-?\d+)%"
-                matches = re.findall(pattern, updated_response)
-                for match in matches:
+                    return getattr(author, "display_name", None)
+                channel = getattr(ctx, "channel", None) or getattr(ctx, "message", None) and getattr(ctx.message, "channel", None)
+                return getattr(channel, "name", None)
+
+            def _substitute(match: re.Match) -> str:
+                name = match.group(1)
+                if name is None:
+                    # Each %rng:min:max% gets its own roll.
+                    min_val, max_val = sorted((int(match.group(2)), int(match.group(3))))
+                    return str(get_random_number(min_val, max_val))
+                if name not in resolved:
                     try:
-                        min_val = int(match[0])
-                        max_val = int(match[1])
-                        if min_val > max_val:
-                            min_val, max_val = max_val, min_val
-                        random_number = str(get_random_number(min_val, max_val))
-                        updated_response = updated_response.replace(f"%rng:{min_val}:{max_val}%", random_number)
+                        resolved[name] = _resolve(name)
                     except Exception:
-                        pass
+                        resolved[name] = None
+                value = resolved[name]
+                # Unresolvable placeholders are left in the text as-is.
+                return match.group(0) if value is None else value
+
+            updated_response = _COMMAND_PLACEHOLDER_RE.sub(_substitute, updated_response)
         return updated_response
     
     async def handle_message(self) -> None: